@@ -0,0 +1,34 @@
+"""
+Media locations used by the content processing tasks.
+
+Resolved once at import time so tasks don't rebuild the same paths on
+every run.
+"""
+import os
+from django.conf import settings
+
+
+MEDIA_ROOT = str(settings.MEDIA_ROOT)
+
+VIDEOS_DIR = f"{MEDIA_ROOT}/videos"
+SUBTITLED_VIDEOS_DIR = f"{VIDEOS_DIR}/subtitled"
+WATERMARKED_VIDEOS_DIR = f"{VIDEOS_DIR}/watermarked"
+
+MEDIA_DIRS = (
+    VIDEOS_DIR,
+    SUBTITLED_VIDEOS_DIR,
+    WATERMARKED_VIDEOS_DIR,
+)
+
+# Scratch files only ffmpeg reads go to tmpfs when available, else the default temp dir
+TMPFS_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def ensure_media_dirs() -> None:
+    """
+    Create the media directories written by the content tasks.
+    
+    Called once when a Celery worker starts instead of on every task.
+    """
+    for directory in MEDIA_DIRS:
+        os.makedirs(directory, exist_ok=True)
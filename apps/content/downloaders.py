@@ -0,0 +1,283 @@
+"""
+Video download helpers for the content app.
+
+Resolves the source platform of a URL and fetches the video file through
+APIHUT.IN (Instagram, YouTube) or yt-dlp (LinkedIn).
+"""
+import os
+import re
+import shutil
+import logging
+import functools
+import threading
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from apps.content.constants import VIDEOS_DIR
+
+logger = logging.getLogger(__name__)
+
+APIHUT_API_URL = settings.APIHUT_API_URL
+
+APIHUT_HEADERS = {
+    'Accept-Language': 'en-US,en;q=0.9,fa;q=0.8',
+    'Connection': 'keep-alive',
+    'Content-Type': 'application/json',
+    'Origin': 'https://apihut.in',
+    'Referer': 'https://apihut.in/docs/api/youtube-instagram-video-downloader',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
+    'accept': 'application/json',
+    'sec-ch-ua': '"Google Chrome";v="141", "Not?A_Brand";v="8", "Chromium";v="141"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+    # 'X-Avatar-Key': settings.APIHUT_API_KEY
+}
+
+# Shared across tasks in a worker so APIHUT and CDN connections are kept alive
+session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+session.mount('https://', _adapter)
+session.mount('http://', _adapter)
+
+PLATFORM_PATTERN = re.compile(r'(instagram\.com|instagr\.am|youtube\.com|youtu\.be|linkedin\.com)', re.IGNORECASE)
+
+PLATFORM_BY_DOMAIN = {
+    'instagram.com': 'instagram',
+    'instagr.am': 'instagram',
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'linkedin.com': 'linkedin',
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def detect_platform(url: str) -> str:
+    """
+    Detect the platform from the URL.
+    
+    Args:
+        url: The video URL
+    
+    Returns:
+        Platform name (instagram, youtube, linkedin, other)
+    """
+    match = PLATFORM_PATTERN.search(url)
+    
+    if not match:
+        return 'other'
+    
+    return PLATFORM_BY_DOMAIN[match.group(1).lower()]
+
+
+def download_video_from_apihut(video_url: str, platform: str) -> dict:
+    """
+    Download video using APIHUT.IN API.
+    
+    Args:
+        video_url: The video URL to download
+        platform: The platform type (instagram, youtube, linkedin)
+    
+    Returns:
+        Dictionary with download information
+    
+    Raises:
+        Exception if download fails
+    """
+    payload = {
+        "video_url": video_url,
+        "type": platform
+    }
+    
+    logger.info("Requesting video download from APIHUT for %s: %s", platform, video_url)
+    
+    response = session.post(APIHUT_API_URL, json=payload, headers=APIHUT_HEADERS, timeout=30)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    
+    if not data.get('success'):
+        raise Exception(f"APIHUT API request failed: {data}")
+    
+    return data
+
+
+_youtube_dl = threading.local()
+
+
+def get_youtube_dl():
+    """
+    Get this thread's yt-dlp instance, creating it on first use.
+    
+    yt_dlp is imported lazily and each instance is reused across tasks, so
+    the extractor registry is loaded once per worker instead of once per
+    download. YoutubeDL is not thread-safe, hence one instance per thread.
+    
+    Returns:
+        yt_dlp.YoutubeDL instance
+    """
+    ydl = getattr(_youtube_dl, 'instance', None)
+    
+    if ydl is None:
+        from yt_dlp import YoutubeDL
+        ydl = YoutubeDL({
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            'socket_timeout': 60,
+            'outtmpl': f"{VIDEOS_DIR}/%(id)s.%(ext)s",
+        })
+        _youtube_dl.instance = ydl
+    
+    return ydl
+
+
+def download_video_from_linkedin(video_url: str) -> dict:
+    """
+    Resolve a LinkedIn video with yt-dlp.
+    
+    Args:
+        video_url: The LinkedIn video URL
+    
+    Returns:
+        Dictionary with download information
+    
+    Raises:
+        Exception if download fails
+    """
+    from yt_dlp.utils import YoutubeDLError
+    
+    logger.info("Resolving LinkedIn video using yt-dlp: %s", video_url)
+    
+    ydl = get_youtube_dl()
+    
+    try:
+        info = ydl.extract_info(video_url, download=False)
+    except YoutubeDLError as e:
+        logger.error("yt-dlp failed: %s", e)
+        raise Exception(f"yt-dlp failed: {e}")
+    
+    # Merged formats have no single URL; take the first one like --get-url does
+    download_url = info.get('url') or next(
+        (fmt.get('url') for fmt in info.get('requested_formats') or [] if fmt.get('url')),
+        None
+    )
+    
+    if not download_url:
+        raise Exception("Failed to extract video URL from yt-dlp")
+    
+    return {
+        'success': 1,
+        'url': download_url,
+        'filename': os.path.basename(ydl.prepare_filename(info))
+    }
+
+
+STREAM_COPY_BUFFER_SIZE = 1024 * 1024
+
+RANGE_DOWNLOAD_MIN_SIZE = 4 * 1024 * 1024
+RANGE_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+RANGE_DOWNLOAD_WORKERS = 4
+
+
+def _download_range(url: str, fd: int, start: int, end: int) -> int:
+    """Download bytes start..end (inclusive) of url and write them at the same offset of fd."""
+    response = session.get(
+        url,
+        headers={'Range': f'bytes={start}-{end}'},
+        stream=True,
+        timeout=(5, 300)
+    )
+    response.raise_for_status()
+    
+    if response.status_code != 206:
+        raise Exception(f"Server ignored Range request for bytes {start}-{end}")
+    
+    offset = start
+    for chunk in response.iter_content(chunk_size=65536):
+        if chunk:
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    
+    return offset - start
+
+
+def _download_in_ranges(url: str, fd: int, total_size: int) -> int:
+    """Download url into fd with parallel HTTP Range requests and return the bytes written."""
+    ranges = [
+        (start, min(start + RANGE_DOWNLOAD_PART_SIZE, total_size) - 1)
+        for start in range(0, total_size, RANGE_DOWNLOAD_PART_SIZE)
+    ]
+    
+    with ThreadPoolExecutor(max_workers=RANGE_DOWNLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(_download_range, url, fd, start, end)
+            for start, end in ranges
+        ]
+        return sum(future.result() for future in futures)
+
+
+def download_file_from_url(url: str, destination_path: str) -> int:
+    """
+    Download a file from URL to destination path.
+    
+    Args:
+        url: URL to download from
+        destination_path: Local path to save the file
+    
+    Returns:
+        File size in bytes
+    
+    Raises:
+        Exception if download fails
+    """
+    logger.info("Downloading file from %s to %s", url, destination_path)
+    
+    response = session.get(url, stream=True, allow_redirects=True, timeout=(5, 300))
+    response.raise_for_status()
+    
+    total_size = int(response.headers.get('content-length', 0))
+    # Content-Length is the encoded size when the body is compressed
+    size_is_exact = total_size > 0 and 'content-encoding' not in response.headers
+    
+    use_ranges = (
+        size_is_exact
+        and total_size >= RANGE_DOWNLOAD_MIN_SIZE
+        and response.headers.get('accept-ranges') == 'bytes'
+        and hasattr(os, 'pwrite')
+    )
+    
+    with open(destination_path, 'wb') as f:
+        if size_is_exact and hasattr(os, 'posix_fallocate'):
+            # Reserve the whole file up front instead of growing it chunk by chunk
+            os.posix_fallocate(f.fileno(), 0, total_size)
+        
+        if use_ranges:
+            # Fetch the body over several connections instead of this single stream
+            response.close()
+            downloaded = _download_in_ranges(response.url, f.fileno(), total_size)
+        else:
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, f, length=STREAM_COPY_BUFFER_SIZE)
+            # File size can't be used here, posix_fallocate may have already extended it
+            downloaded = f.tell()
+
+    if size_is_exact and downloaded != total_size:
+        raise OSError(f"Incomplete download: received {downloaded} of {total_size} bytes")
+
+    logger.info("Downloaded %s bytes to %s", downloaded, destination_path)
+
+    return downloaded
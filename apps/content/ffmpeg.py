@@ -0,0 +1,241 @@
+"""
+ffmpeg helpers for the content app.
+
+Runs ffmpeg with machine-readable progress on stdout, so burn tasks can
+report how far along they are without buffering ffmpeg's whole log in memory.
+"""
+import logging
+import functools
+import subprocess
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_TIMEOUT = 600  # 10 minutes
+FFMPEG_STDERR_LINES = 200
+PROGRESS_STEP = 10
+
+# Preferred H.264 encoders, fastest first; libx264 is the software fallback
+VIDEO_ENCODERS = ['h264_nvenc', 'h264_qsv', 'h264_vaapi', 'libx264']
+VAAPI_DEVICE = '/dev/dri/renderD128'
+# Presets of similar speed and quality for encoders that take one; h264_vaapi
+# has no -preset option and libx264 keeps its default (medium)
+ENCODER_PRESETS = {
+    'h264_nvenc': 'p4',
+    'h264_qsv': 'veryfast',
+}
+
+
+def get_media_duration(file_path: str) -> Optional[float]:
+    """
+    Get the duration of a media file using ffprobe.
+
+    Args:
+        file_path: Path to the media file
+
+    Returns:
+        Duration in seconds, or None if it could not be determined
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        file_path
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+        return float(result.stdout.strip())
+    except (OSError, subprocess.SubprocessError, ValueError):
+        logger.warning("Could not read duration of %s", file_path)
+        return None
+
+
+def _encoder_works(encoder: str) -> bool:
+    """
+    Check that an encoder can actually encode a frame on this machine.
+    
+    ffmpeg lists hardware encoders it was built with even when the GPU or
+    driver is missing, so a one-frame test encode is the only reliable check.
+    
+    Args:
+        encoder: ffmpeg encoder name
+    
+    Returns:
+        True if the test encode succeeded
+    """
+    cmd = ['ffmpeg', '-hide_banner', '-loglevel', 'error']
+    if encoder == 'h264_vaapi':
+        cmd += ['-vaapi_device', VAAPI_DEVICE]
+    cmd += ['-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1', '-frames:v', '1']
+    if encoder == 'h264_vaapi':
+        cmd += ['-vf', 'format=nv12,hwupload']
+    cmd += ['-c:v', encoder, '-f', 'null', '-']
+    
+    try:
+        subprocess.run(cmd, capture_output=True, check=True, timeout=30)
+        return True
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_video_encoder() -> str:
+    """
+    Pick the fastest H.264 encoder available, probing ffmpeg once per process.
+    
+    Returns:
+        Encoder name from VIDEO_ENCODERS, libx264 if no hardware encoder works
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=30
+        )
+        available = result.stdout
+    except (OSError, subprocess.SubprocessError):
+        logger.warning("Could not list ffmpeg encoders, using libx264")
+        return 'libx264'
+    
+    for encoder in VIDEO_ENCODERS[:-1]:
+        if f' {encoder} ' in available and _encoder_works(encoder):
+            logger.info("Using hardware video encoder %s", encoder)
+            return encoder
+    
+    return 'libx264'
+
+
+def build_encode_args(
+    input_paths: list,
+    filter_option: str,
+    filter_graph: str,
+    output_path: str
+) -> list:
+    """
+    Build ffmpeg arguments that filter the inputs and encode with the best encoder.
+    
+    The video is decoded with -hwaccel auto and filtered on the CPU; only the
+    final encode runs on the hardware encoder when one is available. Audio is copied.
+    
+    Args:
+        input_paths: Input files, the video first
+        filter_option: '-vf' or '-filter_complex'
+        filter_graph: Filter graph producing the output video
+        output_path: Path of the output file
+    
+    Returns:
+        Argument list for run_ffmpeg
+    """
+    encoder = get_video_encoder()
+    
+    args = []
+    if encoder == 'h264_vaapi':
+        # Upload the CPU-filtered frames to the VAAPI device for encoding
+        args += ['-vaapi_device', VAAPI_DEVICE]
+        filter_graph = f"{filter_graph},format=nv12,hwupload"
+    
+    args += ['-hwaccel', 'auto']
+    for input_path in input_paths:
+        args += ['-i', input_path]
+    
+    args += [filter_option, filter_graph, '-c:v', encoder]
+    if encoder in ENCODER_PRESETS:
+        args += ['-preset', ENCODER_PRESETS[encoder]]
+    args += ['-c:a', 'copy', '-y', output_path]
+    
+    return args
+
+
+def run_ffmpeg(
+    args: list,
+    duration: Optional[float] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+    timeout: int = FFMPEG_TIMEOUT
+) -> None:
+    """
+    Run ffmpeg and report encoding progress.
+
+    Only the last lines of stderr are kept for error reporting, and
+    on_progress is called each time progress advances by PROGRESS_STEP percent.
+
+    Args:
+        args: ffmpeg arguments (inputs, filters, output), without the 'ffmpeg' executable
+        duration: Duration of the input in seconds, used to compute progress
+        on_progress: Callback receiving the progress percentage (0-99)
+        timeout: Seconds after which ffmpeg is killed
+
+    Raises:
+        Exception if ffmpeg fails or times out
+    """
+    cmd = [
+        'ffmpeg',
+        '-hide_banner',
+        '-nostats',
+        '-loglevel', 'error',
+        '-progress', 'pipe:1',
+        *args
+    ]
+
+    logger.info("Running ffmpeg command: %s", ' '.join(cmd))
+
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+    stderr_tail = deque(maxlen=FFMPEG_STDERR_LINES)
+    stderr_reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    stderr_reader.start()
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+
+    try:
+        reported = 0
+        for line in process.stdout:
+            if not duration or not on_progress:
+                continue
+
+            key, _, value = line.strip().partition('=')
+            # Both keys are in microseconds
+            if key not in ('out_time_us', 'out_time_ms'):
+                continue
+
+            try:
+                percent = min(99, int(int(value) / (duration * 1_000_000) * 100))
+            except ValueError:
+                continue
+
+            if percent >= reported + PROGRESS_STEP:
+                reported = percent
+                on_progress(percent)
+
+        returncode = process.wait()
+    finally:
+        timer.cancel()
+        # An exception from on_progress would otherwise leave ffmpeg running
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    stderr_reader.join()
+
+    if timed_out.is_set():
+        raise Exception(f"ffmpeg timed out after {timeout} seconds")
+
+    if returncode != 0:
+        raise Exception(f"ffmpeg failed: {''.join(stderr_tail)}")
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0005_watermarktask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subtitleburntask',
+            name='progress',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='watermarktask',
+            name='progress',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_subtitleburntask_progress_watermarktask_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subtitle',
+            name='gemini_file_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
@@ -122,6 +122,7 @@ class Subtitle(models.Model):
     )
     subtitle_text = models.TextField(blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
+    gemini_file_name = models.CharField(max_length=255, blank=True, null=True)  # Uploaded video awaiting processing
     started_at = models.DateTimeField(blank=True, null=True)
     completed_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -158,6 +159,7 @@ class SubtitleBurnTask(models.Model):
         choices=STATUS_CHOICES,
         default='pending'
     )
+    progress = models.PositiveIntegerField(default=0)  # 0-100
     output_file_path = models.CharField(max_length=500, blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
     started_at = models.DateTimeField(blank=True, null=True)
@@ -199,6 +201,7 @@ class WatermarkTask(models.Model):
         choices=STATUS_CHOICES,
         default='pending'
     )
+    progress = models.PositiveIntegerField(default=0)  # 0-100
     output_file_path = models.CharField(max_length=500, blank=True, null=True)
     error_message = models.TextField(blank=True, null=True)
     started_at = models.DateTimeField(blank=True, null=True)
@@ -0,0 +1,197 @@
+"""
+Prompt templates for Gemini subtitle generation and translation.
+"""
+
+
+SRT_PROMPT = """
+🎯 **OBJECTIVE**
+Generate professional-quality subtitles for this video in **SRT format**.  
+The subtitles must be accurate, natural, easy to read, and perfectly formatted — ready to use in any video player.
+
+---
+
+### 🧠 ROLE
+You are a professional subtitle creator.  
+Your job is to create subtitles that feel human-made — with clear language, natural rhythm, and valid SRT formatting.
+
+---
+
+### ⚙️ CORE REQUIREMENTS
+
+#### 1. Language
+- Automatically detect the spoken language.  
+- Transcribe in that same language (no translation).  
+- If multiple languages are spoken, keep each phrase in its original language.
+
+#### 2. Subtitle Readability
+- Make subtitles **short, natural, and easy to read**.  
+- Each subtitle block should be **4–10 words** (ideally one full thought per line).  
+- Split long sentences naturally at pauses or commas.  
+- Avoid running multiple sentences in a single subtitle.  
+- Each block should be **1–2 short lines max**.  
+- Remove unnecessary fillers (“uh”, “um”) unless they carry meaning.  
+- Maintain punctuation and capitalization for clarity.
+
+#### 3. Timing Precision
+- Each subtitle should last **1–4 seconds** (never longer than 6 seconds).  
+- Sync timestamps naturally to speech rhythm.  
+- Overlapping timestamps are not allowed.
+
+#### 4. Timestamp Format
+Use the exact structure:
+```
+
+HH:MM:SS,mmm --> HH:MM:SS,mmm
+
+```
+Rules:
+- Always use commas `,` before milliseconds (not dots).  
+- Milliseconds must have **3 digits**.  
+- Always **two digits** for hours, minutes, and seconds.  
+- Example:
+  ✅ `00:00:00,000 --> 00:00:03,200`  
+  ✅ `00:01:12,560 --> 00:01:16,910`
+
+#### 5. SRT Structure
+Every subtitle block must strictly follow this format:
+```
+
+1
+00:00:00,000 --> 00:00:03,200
+Subtitle text here.
+
+2
+00:00:03,200 --> 00:00:06,800
+Next subtitle line.
+
+```
+
+Rules:
+- Each block has:
+  1. A sequential index (starting at 1)  
+  2. A timestamp line  
+  3. One or two short text lines  
+  4. A blank line after each block  
+- Text must always appear **below** the timestamp line (never on the same line).  
+- Do **not** include explanations, notes, or metadata.
+
+#### 6. Output Format
+- Return **only valid, clean `.srt` text** — ready to save directly.  
+- No markdown, code fences, or additional commentary.  
+- Ensure line breaks and numbering are clean and consistent.  
+- Validate that timestamps are in chronological order and properly aligned.
+
+---
+
+### ✅ EXAMPLE OUTPUT
+
+```
+
+1
+00:00:00,000 --> 00:00:02,600
+Hey everyone, welcome back!
+
+2
+00:00:02,600 --> 00:00:05,300
+Today I’ll show you how to use ChatGPT.
+
+3
+00:00:05,300 --> 00:00:07,900
+Let’s get started.
+
+```
+
+---
+
+### 🧩 FINAL REMINDERS
+- Subtitles must look **professional, concise, and human-timed**.  
+- **Never attach text to timestamps** (like `01:34:600And`).  
+- **Always** use commas in timestamps.  
+- **Keep subtitles short, natural, and perfectly formatted.**  
+- Output must be **only valid `.srt` text**, nothing else.
+"""
+
+
+TRANSLATION_PROMPT_TEMPLATE = """
+🎯 **OBJECTIVE**
+Translate the following video subtitles into **{target_language}**, producing a smooth, natural, and culturally appropriate version that feels as if it were originally written in {target_language} — while keeping the exact same SRT structure and timing.
+
+---
+
+### 🧠 ROLE
+You are a professional subtitle translator and localization expert. Your goal is to create subtitles that sound authentic, natural, and emotionally accurate to native {target_language} viewers.
+
+---
+
+### ⚙️ CORE REQUIREMENTS
+
+#### 1. Natural, Native-Like Translation
+- Translate ONLY the dialogue text, not the timestamps or numbering.
+- Make the translation **sound natural and conversational**, not word-for-word.
+- Adapt idioms, tone, and phrasing to what feels native in {target_language}.
+- Preserve meaning, intent, and mood — prioritize clarity and emotional accuracy over literal structure.
+- Keep cultural references understandable for {target_language} speakers.
+- Keep names, brands, and technical terms in the original language unless translation is widely known or adds clarity.
+
+#### 2. Format Preservation
+- Keep ALL timestamps EXACTLY as they are - DO NOT modify timing
+- Maintain the exact SRT structure:
+  - Sequential numbering (1, 2, 3, ...)
+  - Timestamp format: HH:MM:SS,mmm --> HH:MM:SS,mmm
+  - Blank lines between subtitle blocks
+- Keep line breaks and subtitle segmentation
+- Preserve punctuation style appropriate for {target_language}
+
+#### 3. Text Length & Readability
+- Keep translations concise and readable
+- Try to match the original text length when possible
+- If translation is longer, you may split into 2 short lines
+- Ensure subtitles remain easy to read at original timing
+
+#### 4. Output Format
+- No markdown, code fences, or explanations
+- Translate for naturalness, not literal accuracy.
+- Keep meaning, emotion, and tone intact.
+- Maintain exact SRT formatting and timestamps.
+- Output should look like a professionally translated subtitle file.
+
+---
+
+### ✅ EXAMPLE
+
+**Original (English):**
+```
+1
+00:00:00,000 --> 00:00:03,200
+Hey everyone, welcome back!
+
+2
+00:00:03,200 --> 00:00:06,800
+Today I'll show you something cool.
+```
+
+**Translated (Persian):**
+```
+1
+00:00:00,000 --> 00:00:03,200
+سلام به همه، خوش برگشتید!
+
+2
+00:00:03,200 --> 00:00:06,800
+امروز یه چیز جالب نشونتون میدم.
+```
+
+---
+
+### 🧩 FINAL REMINDERS
+- ONLY translate the subtitle text, NOT the timestamps or numbers
+- Maintain the exact same SRT structure
+- Output must be clean, valid SRT format
+- Use natural, native {target_language}
+
+---
+
+### SOURCE SUBTITLE TO TRANSLATE:
+
+{source_subtitle_text}
+"""
@@ -82,7 +82,7 @@ content_create_schema = extend_schema(
             ],
         ),
         400: OpenApiResponse(
-            description='Bad request - Invalid data, content already exists, or search result mismatch',
+            description='Bad request - Invalid data or content already exists',
             examples=[
                 OpenApiExample(
                     'Content Already Exists',
@@ -90,12 +90,6 @@ content_create_schema = extend_schema(
                         'error': 'Content already exists for this project.',
                     },
                 ),
-                OpenApiExample(
-                    'Search Result Mismatch',
-                    value={
-                        'error': 'Search result does not belong to this project.',
-                    },
-                ),
                 OpenApiExample(
                     'Validation Error',
                     value={
@@ -119,7 +113,7 @@ content_create_schema = extend_schema(
                 OpenApiExample(
                     'Search Result Not Found',
                     value={
-                        'error': 'Search result not found.',
+                        'error': 'Search result not found in this project.',
                     },
                 ),
             ],
@@ -372,24 +366,13 @@ video_download_task_detail_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Access denied - User does not own the project',
-            examples=[
-                OpenApiExample(
-                    'Access Denied',
-                    value={
-                        'error': 'Access denied.',
-                    },
-                ),
-            ],
-        ),
         404: OpenApiResponse(
-            description='Download task not found',
+            description='Download task not found or not owned by the user',
             examples=[
                 OpenApiExample(
                     'Task Not Found',
                     value={
-                        'error': 'Download task not found.',
+                        'error': 'Download task not found or access denied.',
                     },
                 ),
             ],
@@ -602,11 +585,8 @@ subtitle_delete_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Subtitle does not belong to this project'
-        ),
         404: OpenApiResponse(
-            description='Project or subtitle not found',
+            description='Project or subtitle not found, or not owned by the user',
         ),
     },
 )
@@ -614,12 +594,13 @@ subtitle_delete_schema = extend_schema(
 
 subtitle_translate_schema = extend_schema(
     operation_id='translate_subtitle',
-    summary='Translate subtitle to another language (synchronous)',
+    summary='Translate subtitle to another language',
     description=(
-        'Translates an existing subtitle to a different language using AI synchronously. '
+        'Starts translating an existing subtitle to a different language using AI. '
         'The translation preserves the SRT format and timing. '
         'Default target language is Persian. '
-        'This is a synchronous operation that returns the completed translation immediately. '
+        'The translation runs in the background; the returned subtitle is pending '
+        'and can be polled through the subtitle list until it is completed or failed. '
         'If a translation to the target language already exists and has failed, it will retry the translation. '
         'If the translation exists and is not failed, an error will be returned.'
     ),
@@ -635,12 +616,12 @@ subtitle_translate_schema = extend_schema(
         ),
     ],
     responses={
-        200: OpenApiResponse(
+        201: OpenApiResponse(
             response=SubtitleSerializer,
-            description='Translation completed successfully',
+            description='Translation task created successfully',
             examples=[
                 OpenApiExample(
-                    'Translation Completed',
+                    'Translation Started',
                     value={
                         'id': 'cc0e8400-e29b-41d4-a716-446655440000',
                         'content': '990e8400-e29b-41d4-a716-446655440000',
@@ -648,14 +629,14 @@ subtitle_translate_schema = extend_schema(
                         'content_url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
                         'platform': 'youtube',
                         'project_title': 'My Video Project',
-                        'task_id': None,
-                        'status': 'completed',
-                        'subtitle_text': '1\n00:00:00,000 --> 00:00:03,000\nمتن زیرنویس اول اینجاست',
+                        'task_id': 'f6e5d4c3-b2a1-4f0e-9d8c-7b6a5f4e3d2c',
+                        'status': 'pending',
+                        'subtitle_text': None,
                         'error_message': None,
-                        'started_at': '2024-01-15T13:00:00Z',
-                        'completed_at': '2024-01-15T13:00:15Z',
+                        'started_at': None,
+                        'completed_at': None,
                         'created_at': '2024-01-15T13:00:00Z',
-                        'updated_at': '2024-01-15T13:00:15Z',
+                        'updated_at': '2024-01-15T13:00:00Z',
                     },
                     response_only=True,
                 ),
@@ -681,22 +662,8 @@ subtitle_translate_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Source subtitle does not belong to this project'
-        ),
         404: OpenApiResponse(
-            description='Project, content, or source subtitle not found',
-        ),
-        500: OpenApiResponse(
-            description='Internal server error - Translation failed due to API or processing error',
-            examples=[
-                OpenApiExample(
-                    'Translation Failed',
-                    value={
-                        'error': 'Translation failed: GEMINI_API_KEY not configured in settings',
-                    },
-                ),
-            ],
+            description='Project, content, or source subtitle not found, or not owned by the user',
         ),
     },
     examples=[
@@ -756,11 +723,8 @@ subtitle_burn_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Subtitle does not belong to this project'
-        ),
         404: OpenApiResponse(
-            description='Project or subtitle not found',
+            description='Project or subtitle not found, or not owned by the user',
         ),
     },
 )
@@ -798,11 +762,8 @@ subtitle_burn_status_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Burn task does not belong to this project'
-        ),
         404: OpenApiResponse(
-            description='Project or burn task not found',
+            description='Project or burn task not found, or not owned by the user',
         ),
     },
 )
@@ -959,6 +920,9 @@ watermark_create_schema = extend_schema(
         'Uploads a watermark image and burns it into the project\'s video. '
         'The watermark will be positioned at the bottom right corner of the video. '
         'PNG images with transparency are recommended for best results. '
+        'If subtitle_id is given, that subtitle is burned in the same pass and '
+        'a matching subtitle burn task is created; its ID is returned as '
+        'burn_task_id, and both tasks report the status of the combined job. '
         'Returns a task that can be monitored for completion.'
     ),
     tags=['Watermarks'],
@@ -984,7 +948,7 @@ watermark_create_schema = extend_schema(
             description='Authentication credentials were not provided or are invalid'
         ),
         404: OpenApiResponse(
-            description='Project or content not found',
+            description='Project, content or subtitle not found, or not owned by the user',
         ),
     },
 )
@@ -1022,11 +986,8 @@ watermark_status_schema = extend_schema(
         401: OpenApiResponse(
             description='Authentication credentials were not provided or are invalid'
         ),
-        403: OpenApiResponse(
-            description='Watermark task does not belong to this project'
-        ),
         404: OpenApiResponse(
-            description='Project or watermark task not found',
+            description='Project or watermark task not found, or not owned by the user',
         ),
     },
 )
@@ -1,8 +1,8 @@
 """
 Selectors for content app - read-only database queries.
 """
-from typing import Optional
-from django.db.models import QuerySet
+from typing import Optional, Sequence
+from django.db.models import Case, IntegerField, QuerySet, Value, When
 from apps.content.models import Content, VideoDownloadTask, Subtitle, SubtitleBurnTask, WatermarkTask
 from apps.search.models import Project
 
@@ -11,18 +11,62 @@ def get_project_content(project: Project) -> Optional[Content]:
     """
     Get content for a project (one-to-one relationship).
     
+    Uses the cached relation when the project was loaded with its content
+    (see get_project_with_content), so no query is made in that case.
+    
     Args:
         project: The project to get content for
     
     Returns:
         Content instance or None if not found
     """
+    if Project.content.is_cached(project):
+        return getattr(project, 'content', None)
+    
     try:
-        return Content.objects.select_related('project').prefetch_related('download_task').get(project=project)
+        return Content.objects.select_related('project', 'download_task').get(project=project)
     except Content.DoesNotExist:
         return None
 
 
+def get_project_with_content(owner_id: int, project_id: str) -> Optional[Project]:
+    """
+    Get a user's project with its content and download task joined in.
+    
+    project.content can then be read without another query; it raises
+    Content.DoesNotExist (an AttributeError) when the project has no content.
+    
+    Args:
+        owner_id: ID of the requesting user
+        project_id: UUID of the Project
+    
+    Returns:
+        Project instance or None if not found or not owned by the user
+    """
+    return Project.objects.select_related('content', 'content__download_task').filter(
+        id=project_id,
+        owner_id=owner_id
+    ).first()
+
+
+def project_has_content(project: Project) -> bool:
+    """
+    Check whether a project already has content, without loading the row.
+    
+    Uses the cached relation when the project was loaded with its content
+    (see get_project_with_content), so no query is made in that case.
+    
+    Args:
+        project: The project to check
+    
+    Returns:
+        True if content exists for the project
+    """
+    if Project.content.is_cached(project):
+        return hasattr(project, 'content')
+    return Content.objects.filter(project_id=project.id).exists()
+
+
 def get_content_by_id(content_id: str) -> Optional[Content]:
     """
     Get content by ID.
@@ -126,6 +170,34 @@ def get_subtitle_by_content(content: Content, language: str = 'original') -> Opt
         return None
 
 
+def get_preferred_completed_subtitle(content: Content, preferred_languages: Sequence[str]) -> Optional[Subtitle]:
+    """
+    Get the completed subtitle with text in the most preferred language.
+    
+    Languages earlier in preferred_languages win; any other language is used
+    only when none of them is available. Ties go to the most recent subtitle.
+    
+    Args:
+        content: The content to get subtitle for
+        preferred_languages: Languages in order of preference
+    
+    Returns:
+        Subtitle instance or None if the content has no completed subtitle with text
+    """
+    language_rank = Case(
+        *(When(language=language, then=Value(rank)) for rank, language in enumerate(preferred_languages)),
+        default=Value(len(preferred_languages)),
+        output_field=IntegerField(),
+    )
+    return (
+        Subtitle.objects.filter(content=content, status='completed', subtitle_text__isnull=False)
+        .exclude(subtitle_text='')
+        .annotate(language_rank=language_rank)
+        .order_by('language_rank', '-created_at')
+        .first()
+    )
+
+
 def list_subtitles_by_content(content: Content) -> QuerySet[Subtitle]:
     """
     List all subtitles for a content.
@@ -134,9 +206,9 @@ def list_subtitles_by_content(content: Content) -> QuerySet[Subtitle]:
         content: The content to list subtitles for
     
     Returns:
-        QuerySet of Subtitle instances
+        QuerySet of Subtitle instances, with content and project joined for serialization
     """
-    return Subtitle.objects.filter(content=content).order_by('-created_at')
+    return Subtitle.objects.filter(content=content).select_related('content', 'content__project').order_by('-created_at')
 
 
 def get_burn_task_by_id(burn_task_id: str) -> Optional[SubtitleBurnTask]:
@@ -170,3 +242,92 @@ def get_watermark_task_by_id(watermark_task_id: str) -> Optional[WatermarkTask]:
     except WatermarkTask.DoesNotExist:
         return None
 
+
+def get_download_task_for_owner(owner_id: int, task_id: str) -> Optional[VideoDownloadTask]:
+    """
+    Get a download task by ID, only if its project belongs to the user.
+    
+    Args:
+        owner_id: ID of the requesting user
+        task_id: UUID of the VideoDownloadTask
+    
+    Returns:
+        VideoDownloadTask instance or None if not found or not owned by the user
+    """
+    try:
+        return VideoDownloadTask.objects.select_related('content').get(
+            id=task_id,
+            content__project__owner_id=owner_id
+        )
+    except VideoDownloadTask.DoesNotExist:
+        return None
+
+
+def get_subtitle_for_owner(owner_id: int, project_id: str, subtitle_id: str) -> Optional[Subtitle]:
+    """
+    Get a subtitle by ID, only if it belongs to the user's project.
+    
+    Args:
+        owner_id: ID of the requesting user
+        project_id: UUID of the Project
+        subtitle_id: UUID of the Subtitle
+    
+    Returns:
+        Subtitle instance or None if not found or not in the user's project
+    """
+    try:
+        return Subtitle.objects.select_related('content').get(
+            id=subtitle_id,
+            content__project_id=project_id,
+            content__project__owner_id=owner_id
+        )
+    except Subtitle.DoesNotExist:
+        return None
+
+
+def get_burn_task_for_owner(owner_id: int, project_id: str, burn_task_id: str) -> Optional[SubtitleBurnTask]:
+    """
+    Get a subtitle burn task by ID, only if it belongs to the user's project.
+    
+    Args:
+        owner_id: ID of the requesting user
+        project_id: UUID of the Project
+        burn_task_id: UUID of the SubtitleBurnTask
+    
+    Returns:
+        SubtitleBurnTask instance or None if not found or not in the user's project
+    """
+    try:
+        # The status response only needs the subtitle's language, not its SRT text
+        return SubtitleBurnTask.objects.select_related('subtitle').defer(
+            'subtitle__subtitle_text',
+            'subtitle__error_message'
+        ).get(
+            id=burn_task_id,
+            subtitle__content__project_id=project_id,
+            subtitle__content__project__owner_id=owner_id
+        )
+    except SubtitleBurnTask.DoesNotExist:
+        return None
+
+
+def get_watermark_task_for_owner(owner_id: int, project_id: str, watermark_task_id: str) -> Optional[WatermarkTask]:
+    """
+    Get a watermark task by ID, only if it belongs to the user's project.
+    
+    Args:
+        owner_id: ID of the requesting user
+        project_id: UUID of the Project
+        watermark_task_id: UUID of the WatermarkTask
+    
+    Returns:
+        WatermarkTask instance or None if not found or not in the user's project
+    """
+    try:
+        return WatermarkTask.objects.get(
+            id=watermark_task_id,
+            content__project_id=project_id,
+            content__project__owner_id=owner_id
+        )
+    except WatermarkTask.DoesNotExist:
+        return None
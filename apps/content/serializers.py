@@ -1,7 +1,51 @@
+import logging
+from datetime import timedelta
+from celery.result import AsyncResult
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from apps.content.models import Content, VideoDownloadTask, Subtitle, SubtitleBurnTask, WatermarkTask
 
+logger = logging.getLogger(__name__)
+
+MEDIA_URL = settings.MEDIA_URL
+# A row written this recently has no newer progress in the result backend
+TASK_PROGRESS_FRESH_FOR = timedelta(seconds=2)
+
+
+def get_task_progress(task) -> int:
+    """
+    Get the progress of a download/burn/watermark task.
+    
+    Running tasks report progress through Celery's result backend and only
+    write the row when they start and finish, so the live value is read
+    from there while the task is active. The stored value is used if the
+    row was just written or the result backend cannot be reached.
+    
+    Args:
+        task: VideoDownloadTask, SubtitleBurnTask or WatermarkTask instance
+    
+    Returns:
+        Progress percentage (0-100)
+    """
+    if task.status not in ['downloading', 'processing'] or not task.task_id:
+        return task.progress
+    
+    if task.updated_at and timezone.now() - task.updated_at < TASK_PROGRESS_FRESH_FOR:
+        return task.progress
+    
+    try:
+        info = AsyncResult(task.task_id).info
+    except Exception as e:
+        logger.warning("Could not read progress of task %s: %s", task.task_id, e)
+        return task.progress
+    
+    if isinstance(info, dict) and 'progress' in info:
+        return info['progress']
+    
+    return task.progress
+
 
 class ContentSerializer(serializers.ModelSerializer):
     """
@@ -26,7 +70,7 @@ class ContentSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'file_path']
+        read_only_fields = fields
     
     @extend_schema_field(serializers.DictField(allow_null=True))
     def get_download_status(self, obj):
@@ -36,7 +80,7 @@ class ContentSerializer(serializers.ModelSerializer):
             return {
                 'task_id': str(task.id),
                 'status': task.status,
-                'progress': task.progress,
+                'progress': get_task_progress(task),
                 'error_message': task.error_message,
             }
         except VideoDownloadTask.DoesNotExist:
@@ -47,20 +91,14 @@ class ContentSerializer(serializers.ModelSerializer):
         """Get the full URL for downloading the video file."""
         if obj.content_type == 'video' and obj.file_path:
             request = self.context.get('request')
+            # Remove leading slash from file_path if present to avoid double slashes
+            file_path = obj.file_path.lstrip('/')
             if request:
                 # Build absolute URL using MEDIA_URL
-                from django.conf import settings
-                media_url = settings.MEDIA_URL
-                # Remove leading slash from file_path if present to avoid double slashes
-                file_path = obj.file_path.lstrip('/')
-                video_url = request.build_absolute_uri(f"{media_url}{file_path}")
-                return video_url
+                return request.build_absolute_uri(f"{MEDIA_URL}{file_path}")
             # Fallback if no request context
-            from django.conf import settings
-            media_url = settings.MEDIA_URL
-            file_path = obj.file_path.lstrip('/')
             # This won't be a full URL but at least a path
-            return f"{media_url}{file_path}"
+            return f"{MEDIA_URL}{file_path}"
         return None
 
 
@@ -77,6 +115,7 @@ class VideoDownloadTaskSerializer(serializers.ModelSerializer):
     """
     content_title = serializers.CharField(source='content.title', read_only=True)
     content_url = serializers.URLField(source='content.source_url', read_only=True)
+    progress = serializers.SerializerMethodField()
     
     class Meta:
         model = VideoDownloadTask
@@ -96,19 +135,12 @@ class VideoDownloadTaskSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = [
-            'id',
-            'task_id',
-            'status',
-            'progress',
-            'error_message',
-            'download_url',
-            'file_size',
-            'started_at',
-            'completed_at',
-            'created_at',
-            'updated_at',
-        ]
+        read_only_fields = fields
+    
+    @extend_schema_field(serializers.IntegerField())
+    def get_progress(self, obj):
+        """Get the live progress while the task is running."""
+        return get_task_progress(obj)
 
 
 class SubtitleSerializer(serializers.ModelSerializer):
@@ -137,17 +169,7 @@ class SubtitleSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = [
-            'id',
-            'task_id',
-            'status',
-            'subtitle_text',
-            'error_message',
-            'started_at',
-            'completed_at',
-            'created_at',
-            'updated_at',
-        ]
+        read_only_fields = fields
 
 
 class SubtitleTranslateSerializer(serializers.Serializer):
@@ -168,7 +190,8 @@ class SubtitleBurnTaskSerializer(serializers.ModelSerializer):
     Serializer for SubtitleBurnTask model.
     """
     subtitle_language = serializers.CharField(source='subtitle.language', read_only=True)
-    content_id = serializers.UUIDField(source='subtitle.content.id', read_only=True)
+    content_id = serializers.UUIDField(source='subtitle.content_id', read_only=True)
+    progress = serializers.SerializerMethodField()
     
     class Meta:
         model = SubtitleBurnTask
@@ -179,6 +202,7 @@ class SubtitleBurnTaskSerializer(serializers.ModelSerializer):
             'content_id',
             'task_id',
             'status',
+            'progress',
             'output_file_path',
             'error_message',
             'started_at',
@@ -186,25 +210,21 @@ class SubtitleBurnTaskSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = [
-            'id',
-            'task_id',
-            'status',
-            'output_file_path',
-            'error_message',
-            'started_at',
-            'completed_at',
-            'created_at',
-            'updated_at',
-        ]
+        read_only_fields = fields
+    
+    @extend_schema_field(serializers.IntegerField())
+    def get_progress(self, obj):
+        """Get the live progress while the task is running."""
+        return get_task_progress(obj)
 
 
 class WatermarkTaskSerializer(serializers.ModelSerializer):
     """
     Serializer for WatermarkTask model.
     """
-    content_id = serializers.UUIDField(source='content.id', read_only=True)
+    content_id = serializers.UUIDField(read_only=True)
     watermark_image_url = serializers.SerializerMethodField()
+    progress = serializers.SerializerMethodField()
     
     class Meta:
         model = WatermarkTask
@@ -216,6 +236,7 @@ class WatermarkTaskSerializer(serializers.ModelSerializer):
             'watermark_image_url',
             'task_id',
             'status',
+            'progress',
             'output_file_path',
             'error_message',
             'started_at',
@@ -223,17 +244,7 @@ class WatermarkTaskSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         ]
-        read_only_fields = [
-            'id',
-            'task_id',
-            'status',
-            'output_file_path',
-            'error_message',
-            'started_at',
-            'completed_at',
-            'created_at',
-            'updated_at',
-        ]
+        read_only_fields = fields
     
     def get_watermark_image_url(self, obj):
         """Get the full URL of the watermark image."""
@@ -243,6 +254,11 @@ class WatermarkTaskSerializer(serializers.ModelSerializer):
                 return request.build_absolute_uri(obj.watermark_image.url)
             return obj.watermark_image.url
         return None
+    
+    @extend_schema_field(serializers.IntegerField())
+    def get_progress(self, obj):
+        """Get the live progress while the task is running."""
+        return get_task_progress(obj)
 
 
 class WatermarkCreateSerializer(serializers.Serializer):
@@ -253,4 +269,8 @@ class WatermarkCreateSerializer(serializers.Serializer):
         help_text='Watermark image file (PNG with transparency recommended)',
         required=True
     )
+    subtitle_id = serializers.UUIDField(
+        help_text='UUID of a completed subtitle to burn in the same pass as the watermark',
+        required=False
+    )
 
@@ -1,7 +1,12 @@
 import logging
-from typing import Optional
+from typing import Optional, Tuple
+from celery.utils import uuid
+from django.db.models import Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from apps.content.models import Content, VideoDownloadTask, Subtitle, SubtitleBurnTask, WatermarkTask
+from apps.content.downloaders import detect_platform
+from apps.content.selectors import project_has_content
 from apps.search.models import Project, SearchResult
 
 logger = logging.getLogger(__name__)
@@ -17,20 +22,8 @@ def detect_content_info(url: str) -> dict:
     Returns:
         Dictionary with content_type and platform
     """
-    url_lower = url.lower()
-    
-    if 'instagram.com' in url_lower or 'instagr.am' in url_lower:
-        platform = 'instagram'
-        content_type = 'video'
-    elif 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-        platform = 'youtube'
-        content_type = 'video'
-    elif 'linkedin.com' in url_lower:
-        platform = 'linkedin'
-        content_type = 'video'
-    else:
-        platform = 'other'
-        content_type = 'text'
+    platform = detect_platform(url)
+    content_type = 'text' if platform == 'other' else 'video'
     
     return {
         'content_type': content_type,
@@ -56,7 +49,7 @@ def create_content_from_search_result(
         ValueError: If content already exists for the project
     """
 
-    if hasattr(project, 'content'):
+    if project_has_content(project):
         raise ValueError("Content already exists for this project")
     
     content_info = detect_content_info(search_result.link)
@@ -68,7 +61,7 @@ def create_content_from_search_result(
         platform=content_info['platform']
     )
     
-    logger.info(f"Created content {content.id} for project {project.id} from search result {search_result.id}")
+    logger.info("Created content %s for project %s from search result %s", content.id, project.id, search_result.id)
     
     if content_info['content_type'] == 'video':
         create_video_download_task(content)
@@ -86,18 +79,17 @@ def create_video_download_task(content: Content) -> VideoDownloadTask:
     Returns:
         Created VideoDownloadTask instance
     """
+    # The Celery task ID is generated up front so it is saved with the row
     task = VideoDownloadTask.objects.create(
         content=content,
+        task_id=uuid(),
         status='pending'
     )
     
-    logger.info(f"Created video download task {task.id} for content {content.id}")
+    logger.info("Created video download task %s for content %s", task.id, content.id)
     
     from apps.content.tasks import download_video_task
-    celery_task = download_video_task.delay(str(task.id))
-    
-    task.task_id = celery_task.id
-    task.save(update_fields=['task_id'])
+    download_video_task.apply_async(args=[str(task.id)], task_id=task.task_id)
     
     return task
 
@@ -109,10 +101,12 @@ def update_download_task_status(
     error_message: str = None,
     download_url: str = None,
     file_size: int = None
-) -> Optional[VideoDownloadTask]:
+) -> bool:
     """
     Update the status of a video download task.
     
+    Issues a single UPDATE statement instead of fetching the row first.
+    
     Args:
         task_id: UUID of the VideoDownloadTask
         status: New status
@@ -122,39 +116,40 @@ def update_download_task_status(
         file_size: Size of the file in bytes
     
     Returns:
-        Updated VideoDownloadTask instance or None if not found
+        True if the task was updated, False if not found
     """
-    task = VideoDownloadTask.objects.get(id=task_id)
-    task.status = status
+    now = timezone.now()
+    fields = {'status': status, 'updated_at': now}
     
     if progress is not None:
-        task.progress = progress
+        fields['progress'] = progress
     
     if error_message is not None:
-        task.error_message = error_message
+        fields['error_message'] = error_message
     
     if download_url is not None:
-        task.download_url = download_url
+        fields['download_url'] = download_url
     
     if file_size is not None:
-        task.file_size = file_size
+        fields['file_size'] = file_size
     
-    if status == 'downloading' and not task.started_at:
-        task.started_at = timezone.now()
+    if status == 'downloading':
+        fields['started_at'] = Coalesce('started_at', Value(now))
     
     if status in ['completed', 'failed']:
-        task.completed_at = timezone.now()
-        task.progress = 100 if status == 'completed' else task.progress
+        fields['completed_at'] = now
+        if status == 'completed':
+            fields['progress'] = 100
 
-    task.save()
+    updated = VideoDownloadTask.objects.filter(id=task_id).update(**fields)
     
-    logger.info(f"Updated download task {task_id} status to {status}")
+    logger.info("Updated download task %s status to %s", task_id, status)
     
-    return task
+    return bool(updated)
 
 
 
-def update_content_file_path(content_id: str, file_path: str) -> Optional[Content]:
+def update_content_file_path(content_id: str, file_path: str) -> bool:
     """
     Update the file path of a content.
     
@@ -163,15 +158,16 @@ def update_content_file_path(content_id: str, file_path: str) -> Optional[Conten
         file_path: Path to the downloaded file
     
     Returns:
-        Updated Content instance or None if not found
+        True if the content was updated, False if not found
     """
-    content = Content.objects.get(id=content_id)
-    content.file_path = file_path
-    content.save(update_fields=['file_path'])
+    updated = Content.objects.filter(id=content_id).update(
+        file_path=file_path,
+        updated_at=timezone.now()
+    )
     
-    logger.info(f"Updated content {content_id} file path to {file_path}")
+    logger.info("Updated content %s file path to %s", content_id, file_path)
     
-    return content
+    return bool(updated)
 
 
 def delete_content(content: Content) -> None:
@@ -189,7 +185,7 @@ def delete_content(content: Content) -> None:
 
     content.delete()
     
-    logger.info(f"Deleted content {content_id} for project {project_id}")
+    logger.info("Deleted content %s for project %s", content_id, project_id)
 
 
 def create_subtitle_generation_task(content: Content, language: str = 'original') -> Subtitle:
@@ -213,16 +209,14 @@ def create_subtitle_generation_task(content: Content, language: str = 'original'
     subtitle = Subtitle.objects.create(
         content=content,
         language=language,
+        task_id=uuid(),
         status='pending'
     )
     
-    logger.info(f"Created subtitle generation task {subtitle.id} for content {content.id} in {language}")
+    logger.info("Created subtitle generation task %s for content %s in %s", subtitle.id, content.id, language)
     
     from apps.content.tasks import generate_subtitle_task
-    celery_task = generate_subtitle_task.delay(str(subtitle.id))
-    
-    subtitle.task_id = celery_task.id
-    subtitle.save(update_fields=['task_id'])
+    generate_subtitle_task.apply_async(args=[str(subtitle.id)], task_id=subtitle.task_id)
     
     return subtitle
 
@@ -232,10 +226,12 @@ def update_subtitle_status(
     status: str,
     subtitle_text: str = None,
     error_message: str = None
-) -> Optional[Subtitle]:
+) -> bool:
     """
     Update the status of a subtitle generation task.
     
+    Issues a single UPDATE statement instead of fetching the row first.
+    
     Args:
         subtitle_id: UUID of the Subtitle
         status: New status
@@ -243,47 +239,66 @@ def update_subtitle_status(
         error_message: Error message if failed
     
     Returns:
-        Updated Subtitle instance or None if not found
+        True if the subtitle was updated, False if not found
     """
-    subtitle = Subtitle.objects.get(id=subtitle_id)
-    subtitle.status = status
+    now = timezone.now()
+    fields = {'status': status, 'updated_at': now}
     
     if subtitle_text is not None:
-        subtitle.subtitle_text = subtitle_text
+        fields['subtitle_text'] = subtitle_text
     
     if error_message is not None:
-        subtitle.error_message = error_message
+        fields['error_message'] = error_message
     
-    if status == 'generating' and not subtitle.started_at:
-        subtitle.started_at = timezone.now()
+    if status == 'generating':
+        fields['started_at'] = Coalesce('started_at', Value(now))
     
     if status in ['completed', 'failed']:
-        subtitle.completed_at = timezone.now()
+        fields['completed_at'] = now
 
-    subtitle.save()
+    updated = Subtitle.objects.filter(id=subtitle_id).update(**fields)
     
-    logger.info(f"Updated subtitle {subtitle_id} status to {status}")
+    logger.info("Updated subtitle %s status to %s", subtitle_id, status)
     
-    return subtitle
+    return bool(updated)
 
 
-def translate_subtitle_synchronous(source_subtitle: Subtitle, target_language: str) -> Subtitle:
+def update_subtitle_gemini_file(subtitle_id: str, gemini_file_name: str) -> bool:
     """
-    Translate a subtitle synchronously using AI.
+    Record the Gemini file a subtitle is waiting on.
+    
+    Args:
+        subtitle_id: UUID of the Subtitle
+        gemini_file_name: Name of the uploaded Gemini file
+    
+    Returns:
+        True if the subtitle was updated, False if not found
+    """
+    updated = Subtitle.objects.filter(id=subtitle_id).update(
+        gemini_file_name=gemini_file_name,
+        updated_at=timezone.now()
+    )
+    
+    return bool(updated)
+
+
+def create_subtitle_translation_task(source_subtitle: Subtitle, target_language: str) -> Subtitle:
+    """
+    Create a subtitle translation task.
+    
+    The translation runs in a Celery task; the returned subtitle starts as
+    pending and can be polled like a generated subtitle.
     
     Args:
         source_subtitle: The source subtitle to translate from
         target_language: Target language for translation
     
     Returns:
-        Created or updated Subtitle instance with translation
+        Created or reset Subtitle instance for the translation
     
     Raises:
         ValueError: If source subtitle is not completed or translation requirements not met
     """
-    from django.conf import settings
-    from google import genai
-    
     if source_subtitle.status != 'completed':
         raise ValueError("Source subtitle must be completed before translation")
     
@@ -300,67 +315,29 @@ def translate_subtitle_synchronous(source_subtitle: Subtitle, target_language: s
     
     if existing_translation and existing_translation.status == 'failed':
         subtitle = existing_translation
-        subtitle.status = 'generating'
+        subtitle.task_id = uuid()
+        subtitle.status = 'pending'
         subtitle.error_message = None
-        subtitle.started_at = timezone.now()
-        subtitle.save(update_fields=['status', 'error_message', 'started_at'])
-        logger.info(f"Retrying failed translation {subtitle.id} to {target_language}")
+        subtitle.started_at = None
+        subtitle.completed_at = None
+        subtitle.save(update_fields=['task_id', 'status', 'error_message', 'started_at', 'completed_at', 'updated_at'])
+        logger.info("Retrying failed translation %s to %s", subtitle.id, target_language)
     else:
         subtitle = Subtitle.objects.create(
             content=source_subtitle.content,
             language=target_language,
-            status='generating',
-            started_at=timezone.now()
+            task_id=uuid(),
+            status='pending'
         )
-        logger.info(f"Created subtitle translation {subtitle.id} from {source_subtitle.id} to {target_language}")
+        logger.info("Created subtitle translation %s from %s to %s", subtitle.id, source_subtitle.id, target_language)
     
-    try:
-        api_key = settings.GEMINI_API_KEY
-        if not api_key:
-            raise Exception("GEMINI_API_KEY not configured in settings")
-        
-        client = genai.Client(api_key=api_key)
-        
-        from apps.content.tasks import TRANSLATION_PROMPT_TEMPLATE
-        prompt = TRANSLATION_PROMPT_TEMPLATE.format(
-            target_language=target_language,
-            source_subtitle_text=source_subtitle.subtitle_text
-        )
-        
-        logger.info(f"Calling Gemini API for subtitle translation to {target_language}")
-        
-        response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=[prompt]
-        )
-        
-        translated_text = response.text.strip()
-        
-        if translated_text.startswith('```'):
-            lines = translated_text.split('\n')
-            if lines[0].startswith('```'):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == '```':
-                lines = lines[:-1]
-            translated_text = '\n'.join(lines)
-        
-        subtitle.subtitle_text = translated_text
-        subtitle.status = 'completed'
-        subtitle.completed_at = timezone.now()
-        subtitle.save(update_fields=['subtitle_text', 'status', 'completed_at'])
-        
-        logger.info(f"Subtitle translation {subtitle.id} completed successfully")
-        
-        return subtitle
-        
-    except Exception as e:
-        subtitle.status = 'failed'
-        subtitle.error_message = str(e)
-        subtitle.completed_at = timezone.now()
-        subtitle.save(update_fields=['status', 'error_message', 'completed_at'])
-        
-        logger.error(f"Subtitle translation {subtitle.id} failed: {str(e)}", exc_info=True)
-        raise
+    from apps.content.tasks import translate_subtitle_task
+    translate_subtitle_task.apply_async(
+        args=[str(subtitle.id), str(source_subtitle.id)],
+        task_id=subtitle.task_id
+    )
+    
+    return subtitle
 
 
 def create_subtitle_burn_task(subtitle: Subtitle) -> SubtitleBurnTask:
@@ -388,16 +365,14 @@ def create_subtitle_burn_task(subtitle: Subtitle) -> SubtitleBurnTask:
     
     burn_task = SubtitleBurnTask.objects.create(
         subtitle=subtitle,
+        task_id=uuid(),
         status='pending'
     )
     
-    logger.info(f"Created subtitle burn task {burn_task.id} for subtitle {subtitle.id}")
+    logger.info("Created subtitle burn task %s for subtitle %s", burn_task.id, subtitle.id)
     
     from apps.content.tasks import burn_subtitle_task
-    celery_task = burn_subtitle_task.delay(str(burn_task.id))
-    
-    burn_task.task_id = celery_task.id
-    burn_task.save(update_fields=['task_id'])
+    burn_subtitle_task.apply_async(args=[str(burn_task.id)], task_id=burn_task.task_id)
     
     return burn_task
 
@@ -405,41 +380,50 @@ def create_subtitle_burn_task(subtitle: Subtitle) -> SubtitleBurnTask:
 def update_burn_task_status(
     burn_task_id: str,
     status: str,
+    progress: int = None,
     output_file_path: str = None,
     error_message: str = None
-) -> Optional[SubtitleBurnTask]:
+) -> bool:
     """
     Update the status of a subtitle burn task.
     
+    Issues a single UPDATE statement instead of fetching the row first.
+    
     Args:
         burn_task_id: UUID of the SubtitleBurnTask
         status: New status
+        progress: Encoding progress (0-100)
         output_file_path: Path to the output video file
         error_message: Error message if failed
     
     Returns:
-        Updated SubtitleBurnTask instance or None if not found
+        True if the task was updated, False if not found
     """
-    burn_task = SubtitleBurnTask.objects.get(id=burn_task_id)
-    burn_task.status = status
+    now = timezone.now()
+    fields = {'status': status, 'updated_at': now}
+    
+    if progress is not None:
+        fields['progress'] = progress
     
     if output_file_path is not None:
-        burn_task.output_file_path = output_file_path
+        fields['output_file_path'] = output_file_path
     
     if error_message is not None:
-        burn_task.error_message = error_message
+        fields['error_message'] = error_message
     
-    if status == 'processing' and not burn_task.started_at:
-        burn_task.started_at = timezone.now()
+    if status == 'processing':
+        fields['started_at'] = Coalesce('started_at', Value(now))
     
     if status in ['completed', 'failed']:
-        burn_task.completed_at = timezone.now()
+        fields['completed_at'] = now
+        if status == 'completed':
+            fields['progress'] = 100
 
-    burn_task.save()
+    updated = SubtitleBurnTask.objects.filter(id=burn_task_id).update(**fields)
     
-    logger.info(f"Updated burn task {burn_task_id} status to {status}")
+    logger.info("Updated burn task %s status to %s", burn_task_id, status)
     
-    return burn_task
+    return bool(updated)
 
 
 def delete_subtitle(subtitle: Subtitle) -> None:
@@ -455,81 +439,120 @@ def delete_subtitle(subtitle: Subtitle) -> None:
     subtitle_id = subtitle.id
     subtitle.delete()
     
-    logger.info(f"Deleted subtitle {subtitle_id}")
+    logger.info("Deleted subtitle %s", subtitle_id)
 
 
-def create_watermark_task(content: Content, watermark_image) -> WatermarkTask:
+def create_watermark_task(
+    content: Content,
+    watermark_image,
+    subtitle: Subtitle = None
+) -> Tuple[WatermarkTask, Optional[SubtitleBurnTask]]:
     """
     Create a watermark task to burn watermark into video.
     
+    When a subtitle is given, a subtitle burn task is created as well and both
+    are rendered in a single ffmpeg pass. The two tasks share one Celery task
+    ID and their statuses are updated together.
+    
     Args:
         content: The content to add watermark to
         watermark_image: The watermark image file uploaded by user
+        subtitle: Optional subtitle to burn together with the watermark
     
     Returns:
-        Created WatermarkTask instance
+        Tuple of (WatermarkTask, SubtitleBurnTask or None if no subtitle was given)
     
     Raises:
-        ValueError: If video not downloaded
+        ValueError: If video not downloaded or subtitle is not completed
     """
     if not content.file_path:
         raise ValueError("Video file must be downloaded before adding watermark")
     
+    if subtitle is not None:
+        if subtitle.status != 'completed':
+            raise ValueError("Subtitle must be completed before burning into video")
+        
+        if not subtitle.subtitle_text:
+            raise ValueError("Subtitle has no text to burn")
+    
     watermark_task = WatermarkTask.objects.create(
         content=content,
         watermark_image=watermark_image,
+        task_id=uuid(),
         status='pending'
     )
     
-    logger.info(f"Created watermark task {watermark_task.id} for content {content.id}")
+    logger.info("Created watermark task %s for content %s", watermark_task.id, content.id)
+    
+    if subtitle is None:
+        from apps.content.tasks import burn_watermark_task
+        burn_watermark_task.apply_async(args=[str(watermark_task.id)], task_id=watermark_task.task_id)
+        return watermark_task, None
+    
+    burn_task = SubtitleBurnTask.objects.create(
+        subtitle=subtitle,
+        task_id=watermark_task.task_id,
+        status='pending'
+    )
     
-    from apps.content.tasks import burn_watermark_task
-    celery_task = burn_watermark_task.delay(str(watermark_task.id))
+    logger.info("Created subtitle burn task %s for subtitle %s", burn_task.id, subtitle.id)
     
-    watermark_task.task_id = celery_task.id
-    watermark_task.save(update_fields=['task_id'])
+    from apps.content.tasks import burn_subtitle_and_watermark_task
+    burn_subtitle_and_watermark_task.apply_async(
+        args=[str(burn_task.id), str(watermark_task.id)],
+        task_id=watermark_task.task_id
+    )
     
-    return watermark_task
+    return watermark_task, burn_task
 
 
 def update_watermark_task_status(
     watermark_task_id: str,
     status: str,
+    progress: int = None,
     output_file_path: str = None,
     error_message: str = None
-) -> Optional[WatermarkTask]:
+) -> bool:
     """
     Update the status of a watermark task.
     
+    Issues a single UPDATE statement instead of fetching the row first.
+    
     Args:
         watermark_task_id: UUID of the WatermarkTask
         status: New status
+        progress: Encoding progress (0-100)
         output_file_path: Path to the output video file
         error_message: Error message if failed
     
     Returns:
-        Updated WatermarkTask instance or None if not found
+        True if the task was updated, False if not found
     """
-    watermark_task = WatermarkTask.objects.get(id=watermark_task_id)
-    watermark_task.status = status
+    now = timezone.now()
+    fields = {'status': status, 'updated_at': now}
+    
+    if progress is not None:
+        fields['progress'] = progress
     
     if output_file_path is not None:
-        watermark_task.output_file_path = output_file_path
+        fields['output_file_path'] = output_file_path
     
     if error_message is not None:
-        watermark_task.error_message = error_message
+        fields['error_message'] = error_message
     
-    if status == 'processing' and not watermark_task.started_at:
-        watermark_task.started_at = timezone.now()
+    if status == 'processing':
+        fields['started_at'] = Coalesce('started_at', Value(now))
     
     if status in ['completed', 'failed']:
-        watermark_task.completed_at = timezone.now()
+        fields['completed_at'] = now
+        if status == 'completed':
+            fields['progress'] = 100
 
-    watermark_task.save()
+    updated = WatermarkTask.objects.filter(id=watermark_task_id).update(**fields)
     
-    logger.info(f"Updated watermark task {watermark_task_id} status to {status}")
+    logger.info("Updated watermark task %s status to %s", watermark_task_id, status)
     
-    return watermark_task
+    return bool(updated)
 
 
 
@@ -1,196 +1,114 @@
 
 import os
-import time
+import re
 import logging
+import tempfile
+import threading
+import httpx
 import requests
-import subprocess
 from celery import shared_task
+from celery.exceptions import Retry
 from django.conf import settings
+from django.db import transaction
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from apps.content.models import VideoDownloadTask, Subtitle, SubtitleBurnTask, WatermarkTask
 from apps.content.services import (
     update_download_task_status,
     update_content_file_path,
     update_subtitle_status,
+    update_subtitle_gemini_file,
     update_burn_task_status,
     update_watermark_task_status,
 )
 from apps.content.selectors import get_download_task_by_id, get_subtitle_by_id, get_burn_task_by_id, get_watermark_task_by_id
+from apps.content.constants import (
+    MEDIA_ROOT,
+    VIDEOS_DIR,
+    SUBTITLED_VIDEOS_DIR,
+    WATERMARKED_VIDEOS_DIR,
+    TMPFS_DIR,
+)
+from apps.content.prompts import SRT_PROMPT, TRANSLATION_PROMPT_TEMPLATE
+from apps.content.ffmpeg import build_encode_args, get_media_duration, run_ffmpeg
+from apps.content.downloaders import (
+    detect_platform,
+    download_video_from_apihut,
+    download_video_from_linkedin,
+    download_file_from_url,
+)
 
 logger = logging.getLogger(__name__)
 
-
-def detect_platform(url: str) -> str:
-    """
-    Detect the platform from the URL.
-    
-    Args:
-        url: The video URL
-    
-    Returns:
-        Platform name (instagram, youtube, linkedin, other)
-    """
-    url_lower = url.lower()
-    
-    if 'instagram.com' in url_lower or 'instagr.am' in url_lower:
-        return 'instagram'
-    elif 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-        return 'youtube'
-    elif 'linkedin.com' in url_lower:
-        return 'linkedin'
-    else:
-        return 'other'
-
-
-def download_video_from_apihut(video_url: str, platform: str) -> dict:
-    """
-    Download video using APIHUT.IN API.
-    
-    Args:
-        video_url: The video URL to download
-        platform: The platform type (instagram, youtube, linkedin)
-    
-    Returns:
-        Dictionary with download information
-    
-    Raises:
-        Exception if download fails
-    """
-    api_url = settings.APIHUT_API_URL
-    api_key = settings.APIHUT_API_KEY
-    
-    payload = {
-        "video_url": video_url,
-        "type": platform
-    }
-    
-    headers = {
-    'Accept-Language': 'en-US,en;q=0.9,fa;q=0.8',
-    'Connection': 'keep-alive',
-    'Content-Type': 'application/json',
-    'Origin': 'https://apihut.in',
-    'Referer': 'https://apihut.in/docs/api/youtube-instagram-video-downloader',
-    'Sec-Fetch-Dest': 'empty',
-    'Sec-Fetch-Mode': 'cors',
-    'Sec-Fetch-Site': 'same-origin',
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36',
-    'accept': 'application/json',
-    'sec-ch-ua': '"Google Chrome";v="141", "Not?A_Brand";v="8", "Chromium";v="141"',
-    'sec-ch-ua-mobile': '?0',
-    'sec-ch-ua-platform': '"Windows"',
-    # 'X-Avatar-Key': api_key
-    }
-    
-    logger.info(f"Requesting video download from APIHUT for {platform}: {video_url}")
-    
-    response = requests.post(api_url, json=payload, headers=headers, timeout=30)
-    response.raise_for_status()
-    
-    data = response.json()
-    
-    if not data.get('success'):
-        raise Exception(f"APIHUT API request failed: {data}")
-    
-    return data
+_genai_client = None
+_genai_client_lock = threading.Lock()
+
+# Errors worth retrying; anything else (unsupported platform, missing file or
+# API key, invalid model output) fails the task on the first attempt
+TRANSIENT_ERRORS = (
+    requests.RequestException,
+    httpx.TransportError,
+    genai_errors.ServerError,
+    OSError,
+    TimeoutError,
+)
 
 
-def download_video_from_linkedin(video_url: str) -> dict:
+def get_genai_client() -> genai.Client:
     """
-    Download video from LinkedIn using yt-dlp.
-    
-    Args:
-        video_url: The LinkedIn video URL
+    Get the process-wide Gemini client, creating it on first use.
     
     Returns:
-        Dictionary with download information
+        Shared genai.Client instance
     
     Raises:
-        Exception if download fails
+        Exception if GEMINI_API_KEY is not configured
     """
-    logger.info(f"Downloading LinkedIn video using yt-dlp: {video_url}")
+    global _genai_client
     
-    media_dir = os.path.join(settings.MEDIA_ROOT, 'videos')
-    os.makedirs(media_dir, exist_ok=True)
+    if _genai_client is None:
+        with _genai_client_lock:
+            if _genai_client is None:
+                api_key = settings.GEMINI_API_KEY
+                if not api_key:
+                    raise Exception("GEMINI_API_KEY not configured in settings")
+                _genai_client = genai.Client(api_key=api_key)
     
-    output_template = os.path.join(media_dir, '%(id)s.%(ext)s')
+    return _genai_client
 
-    cmd = [
-        'yt-dlp',
-        '--get-url',
-        '--get-filename',
-        '-o', output_template,
-        video_url
-    ]
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=60
-        )
-        
-        lines = result.stdout.strip().split('\n')
-        
-        if len(lines) >= 2:
-            download_url = lines[0]
-            filename = os.path.basename(lines[1])
-            
-            return {
-                'success': 1,
-                'url': download_url,
-                'filename': filename
-            }
-        else:
-            raise Exception("Failed to extract video URL from yt-dlp")
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"yt-dlp command failed: {e.stderr}")
-        raise Exception(f"yt-dlp failed: {e.stderr}")
-
-    except subprocess.TimeoutExpired:
-        logger.error("yt-dlp command timed out")
-        raise Exception("yt-dlp timed out")
-
-
-def download_file_from_url(url: str, destination_path: str) -> int:
+def will_retry(task, exc: Exception) -> bool:
     """
-    Download a file from URL to destination path.
+    Check whether autoretry_for will reschedule a task after an error.
     
     Args:
-        url: URL to download from
-        destination_path: Local path to save the file
+        task: Bound Celery task retrying on TRANSIENT_ERRORS
+        exc: Error raised by the current attempt
     
     Returns:
-        File size in bytes
-    
-    Raises:
-        Exception if download fails
+        True if the error is transient and retries remain
     """
-    logger.info(f"Downloading file from {url} to {destination_path}")
-    
-    response = requests.get(url, stream=True, timeout=300)
-    response.raise_for_status()
-    
-    total_size = int(response.headers.get('content-length', 0))
-    
-    os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-    
-    with open(destination_path, 'wb') as f:
-        downloaded = 0
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
+    return isinstance(exc, TRANSIENT_ERRORS) and task.request.retries < task.max_retries
 
-    logger.info(f"Downloaded {downloaded} bytes to {destination_path}")
 
-    return downloaded
+# Resolves a download URL for a video, keyed by platform
+PLATFORM_DOWNLOADERS = {
+    'instagram': download_video_from_apihut,
+    'youtube': download_video_from_apihut,
+    'linkedin': lambda video_url, platform: download_video_from_linkedin(video_url),
+}
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    max_retries=7,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
+)
 def download_video_task(self, task_id: str):
     """
     Celery task to download a video.
@@ -201,13 +119,16 @@ def download_video_task(self, task_id: str):
     Returns:
         Dictionary with result information
     """
-    logger.info(f"Starting video download task {task_id}")
+    logger.info("Starting video download task %s", task_id)
+    
+    download_url = None
     
     try:
+        # Selector joins content, so task.content below needs no extra query
         task = get_download_task_by_id(task_id)
         
         if not task:
-            logger.error(f"VideoDownloadTask {task_id} not found")
+            logger.error("VideoDownloadTask %s not found", task_id)
             return {'status': 'error', 'message': 'Task not found'}
         
         update_download_task_status(
@@ -225,22 +146,14 @@ def download_video_task(self, task_id: str):
             content.platform = platform
             content.save(update_fields=['platform'])
         
-        logger.info(f"Downloading video from {platform}: {video_url}")
+        logger.info("Downloading video from %s: %s", platform, video_url)
         
-        download_info = None
+        downloader = PLATFORM_DOWNLOADERS.get(platform)
         
-        if platform == 'linkedin':
-            download_info = download_video_from_linkedin(video_url)
-        elif platform in ['instagram', 'youtube']:
-            download_info = download_video_from_apihut(video_url, platform)
-        else:
+        if not downloader:
             raise Exception(f"Unsupported platform: {platform}")
         
-        update_download_task_status(
-            task_id=task_id,
-            status='processing',
-            progress=30
-        )
+        download_info = downloader(video_url, platform)
         
         if platform == 'instagram':
             video_data = download_info.get('data', [])[0] if download_info.get('data') else None
@@ -256,35 +169,31 @@ def download_video_task(self, task_id: str):
         if not download_url:
             raise Exception("No download URL found in response")
         
-        logger.info(f"Got download URL: {download_url}")
+        logger.info("Got download URL: %s", download_url)
 
-        update_download_task_status(
-            task_id=task_id,
-            status='downloading',
-            progress=50,
-            download_url=download_url
-        )
-        
-        media_dir = os.path.join(settings.MEDIA_ROOT, 'videos')
-        os.makedirs(media_dir, exist_ok=True)
+        # Intermediate progress goes to the result backend; the row is only
+        # written when the task starts and finishes
+        self.update_state(state='PROGRESS', meta={'progress': 50, 'stage': 'downloading'})
         
         file_extension = 'mp4'
         filename = f"{content.id}.{file_extension}"
-        file_path = os.path.join(media_dir, filename)
+        file_path = f"{VIDEOS_DIR}/{filename}"
         
         file_size = download_file_from_url(download_url, file_path)
         
-        relative_path = os.path.join('videos', filename)
-        update_content_file_path(str(content.id), relative_path)
+        relative_path = f"videos/{filename}"
         
-        update_download_task_status(
-            task_id=task_id,
-            status='completed',
-            progress=100,
-            file_size=file_size
-        )
+        with transaction.atomic():
+            update_content_file_path(str(content.id), relative_path)
+            update_download_task_status(
+                task_id=task_id,
+                status='completed',
+                progress=100,
+                download_url=download_url,
+                file_size=file_size
+            )
         
-        logger.info(f"Video download task {task_id} completed successfully")
+        logger.info("Video download task %s completed successfully", task_id)
         
         return {
             'status': 'success',
@@ -294,153 +203,212 @@ def download_video_task(self, task_id: str):
         }
     
     except Exception as e:
-        logger.error(f"Video download task {task_id} failed: {str(e)}", exc_info=True)
+        if will_retry(self, e):
+            logger.warning("Video download task %s failed, retrying: %s", task_id, e)
+            # Re-raise so autoretry_for reschedules with exponential backoff
+            raise
+        
+        logger.error("Video download task %s failed: %s", task_id, e, exc_info=True)
         
         update_download_task_status(
             task_id=task_id,
             status='failed',
-            error_message=str(e)
+            error_message=str(e),
+            download_url=download_url
         )
         
-        try:
-            raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            logger.error(f"Max retries exceeded for task {task_id}")
-            return {
-                'status': 'error',
-                'task_id': task_id,
-                'message': str(e)
-            }
-
-
-SRT_PROMPT = """
-🎯 **OBJECTIVE**
-Generate professional-quality subtitles for this video in **SRT format**.  
-The subtitles must be accurate, natural, easy to read, and perfectly formatted — ready to use in any video player.
+        raise
 
----
 
-### 🧠 ROLE
-You are a professional subtitle creator.  
-Your job is to create subtitles that feel human-made — with clear language, natural rhythm, and valid SRT formatting.
+SRT_PROMPT_PART = types.Part(text=SRT_PROMPT)
 
----
 
-### ⚙️ CORE REQUIREMENTS
 
-#### 1. Language
-- Automatically detect the spoken language.  
-- Transcribe in that same language (no translation).  
-- If multiple languages are spoken, keep each phrase in its original language.
+CODE_FENCE_PATTERN = re.compile(r'^\s*```[\w-]*[ \t]*\n(.*?)\n?```\s*$', re.DOTALL)
 
-#### 2. Subtitle Readability
-- Make subtitles **short, natural, and easy to read**.  
-- Each subtitle block should be **4–10 words** (ideally one full thought per line).  
-- Split long sentences naturally at pauses or commas.  
-- Avoid running multiple sentences in a single subtitle.  
-- Each block should be **1–2 short lines max**.  
-- Remove unnecessary fillers (“uh”, “um”) unless they carry meaning.  
-- Maintain punctuation and capitalization for clarity.
 
-#### 3. Timing Precision
-- Each subtitle should last **1–4 seconds** (never longer than 6 seconds).  
-- Sync timestamps naturally to speech rhythm.  
-- Overlapping timestamps are not allowed.
-
-#### 4. Timestamp Format
-Use the exact structure:
-```
-
-HH:MM:SS,mmm --> HH:MM:SS,mmm
-
-```
-Rules:
-- Always use commas `,` before milliseconds (not dots).  
-- Milliseconds must have **3 digits**.  
-- Always **two digits** for hours, minutes, and seconds.  
-- Example:
-  ✅ `00:00:00,000 --> 00:00:03,200`  
-  ✅ `00:01:12,560 --> 00:01:16,910`
-
-#### 5. SRT Structure
-Every subtitle block must strictly follow this format:
-```
-
-1
-00:00:00,000 --> 00:00:03,200
-Subtitle text here.
+def strip_code_fence(text: str) -> str:
+    """
+    Remove a surrounding markdown code fence (e.g. ```srt ... ```) from model output.
+    
+    Args:
+        text: Raw text returned by the model
+    
+    Returns:
+        The fenced body if the text is wrapped in a code fence, otherwise the text unchanged
+    """
+    match = CODE_FENCE_PATTERN.match(text)
+    
+    if not match:
+        return text
+    
+    return match.group(1)
 
-2
-00:00:03,200 --> 00:00:06,800
-Next subtitle line.
 
-```
+SRT_CUE_PATTERN = re.compile(r'^\d+\s+\d\d:\d\d:\d\d,\d{3} --> \d\d:\d\d:\d\d,\d{3}', re.MULTILINE)
 
-Rules:
-- Each block has:
-  1. A sequential index (starting at 1)  
-  2. A timestamp line  
-  3. One or two short text lines  
-  4. A blank line after each block  
-- Text must always appear **below** the timestamp line (never on the same line).  
-- Do **not** include explanations, notes, or metadata.
 
-#### 6. Output Format
-- Return **only valid, clean `.srt` text** — ready to save directly.  
-- No markdown, code fences, or additional commentary.  
-- Ensure line breaks and numbering are clean and consistent.  
-- Validate that timestamps are in chronological order and properly aligned.
+def clean_srt(text: str) -> str:
+    """
+    Strip code fences from model output and check that it contains SRT cues.
+    
+    Catching a malformed response here fails the subtitle immediately instead
+    of letting a later burn task fail after a full ffmpeg encode.
+    
+    Args:
+        text: Raw text returned by the model
+    
+    Returns:
+        The SRT content
+    
+    Raises:
+        ValueError if the text contains no SRT cue
+    """
+    srt_text = strip_code_fence(text.strip()).strip()
+    
+    if not SRT_CUE_PATTERN.search(srt_text):
+        raise ValueError("Model response is not valid SRT")
+    
+    return srt_text
 
----
 
-### ✅ EXAMPLE OUTPUT
+GEMINI_FILE_POLL_MAX_DELAY = 60
+GEMINI_FILE_POLL_MAX_RETRIES = 60
 
-```
 
-1
-00:00:00,000 --> 00:00:02,600
-Hey everyone, welcome back!
+def upload_video_to_gemini(client: genai.Client, video_file_path: str, previous_file_name: str = None):
+    """
+    Upload a local video to Gemini without waiting for it to be processed.
+    
+    The file name of an earlier upload is persisted on the Subtitle, so a
+    retry on any worker reuses that upload instead of sending the whole file
+    again. Gemini deletes uploads after 48 hours; an expired or FAILED file
+    is uploaded again.
+    
+    Args:
+        client: Gemini client
+        video_file_path: Absolute path of the video file
+        previous_file_name: Gemini file name of an earlier upload of the video
+    
+    Returns:
+        The Gemini file object, possibly still PROCESSING
+    
+    Raises:
+        FileNotFoundError if the video file does not exist
+    """
+    if previous_file_name:
+        try:
+            myfile = client.files.get(name=previous_file_name)
+            if myfile.state.name != "FAILED":
+                logger.info("Reusing uploaded Gemini file %s for %s", previous_file_name, video_file_path)
+                return myfile
+        except Exception as e:
+            logger.warning("Gemini file %s is unusable, uploading again: %s", previous_file_name, e)
+    
+    if not os.path.exists(video_file_path):
+        raise FileNotFoundError(video_file_path)
+    
+    logger.info("Uploading video to Gemini: %s", video_file_path)
+    
+    myfile = client.files.upload(file=video_file_path)
+    logger.info("File uploaded (File ID: %s)", myfile.name)
+    
+    return myfile
 
-2
-00:00:02,600 --> 00:00:05,300
-Today I’ll show you how to use ChatGPT.
 
-3
-00:00:05,300 --> 00:00:07,900
-Let’s get started.
+SRT_STREAM_PROGRESS_STEP = 4096  # characters
 
-```
 
----
+def generate_srt(task, client: genai.Client, model: str, contents) -> str:
+    """
+    Stream an SRT from Gemini, reporting how much has been received so far.
+    
+    Args:
+        task: Bound Celery task used to publish progress
+        client: Gemini client
+        model: Gemini model name
+        contents: Request contents (video and SRT prompt)
+    
+    Returns:
+        The raw response text
+    """
+    chunks = []
+    received = 0
+    reported = 0
+    
+    for chunk in client.models.generate_content_stream(model=model, contents=contents):
+        if not chunk.text:
+            continue
+        
+        chunks.append(chunk.text)
+        received += len(chunk.text)
+        
+        if received - reported >= SRT_STREAM_PROGRESS_STEP:
+            reported = received
+            task.update_state(state='PROGRESS', meta={'characters': received})
+    
+    return ''.join(chunks)
 
-### 🧩 FINAL REMINDERS
-- Subtitles must look **professional, concise, and human-timed**.  
-- **Never attach text to timestamps** (like `01:34:600And`).  
-- **Always** use commas in timestamps.  
-- **Keep subtitles short, natural, and perfectly formatted.**  
-- Output must be **only valid `.srt` text**, nothing else.
-"""
 
+def complete_subtitle_generation(subtitle_id: str, subtitle_text: str) -> dict:
+    """
+    Store the SRT returned by Gemini and mark the subtitle as completed.
+    
+    Args:
+        subtitle_id: UUID of the Subtitle
+        subtitle_text: Raw response text from Gemini
+    
+    Returns:
+        Dictionary with result information
+    
+    Raises:
+        ValueError if the response is not valid SRT
+    """
+    update_subtitle_status(
+        subtitle_id=subtitle_id,
+        status='completed',
+        subtitle_text=clean_srt(subtitle_text)
+    )
+    
+    logger.info("Subtitle generation task %s completed successfully", subtitle_id)
+    
+    return {
+        'status': 'success',
+        'subtitle_id': subtitle_id,
+    }
 
 
-@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@shared_task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    max_retries=7,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
+)
 def generate_subtitle_task(self, subtitle_id: str):
     """
     Celery task to generate subtitles for a video.
     
+    YouTube videos are transcribed directly. Instagram/LinkedIn videos are
+    uploaded to Gemini and handed to poll_subtitle_file_task, so the worker
+    is not blocked while Gemini processes the file.
+    
     Args:
         subtitle_id: UUID of the Subtitle
     
     Returns:
         Dictionary with result information
     """
-    logger.info(f"Starting subtitle generation task {subtitle_id}")
+    logger.info("Starting subtitle generation task %s", subtitle_id)
     
     try:
+        # Selector joins content, so subtitle.content below needs no extra query
         subtitle = get_subtitle_by_id(subtitle_id)
         
         if not subtitle:
-            logger.error(f"Subtitle {subtitle_id} not found")
+            logger.error("Subtitle %s not found", subtitle_id)
             return {'status': 'error', 'message': 'Subtitle not found'}
         
         update_subtitle_status(
@@ -452,186 +420,299 @@ def generate_subtitle_task(self, subtitle_id: str):
         platform = content.platform
         video_url = content.source_url
         
-        logger.info(f"Generating subtitle for {platform} video: {video_url}")
-        
-        
-        api_key = settings.GEMINI_API_KEY
+        logger.info("Generating subtitle for %s video: %s", platform, video_url)
         
-        if not api_key:
-            raise Exception("GEMINI_API_KEY not configured in settings")
-        
-        client = genai.Client(api_key=api_key)
+        client = get_genai_client()
         
         if platform in ['instagram', 'linkedin']:
             if not content.file_path:
                 raise Exception(f"Video file not downloaded for {platform}. Cannot generate subtitles without downloaded video file.")
             
-            video_file_path = os.path.join(settings.MEDIA_ROOT, content.file_path)
+            video_file_path = f"{MEDIA_ROOT}/{content.file_path}"
             
-            if not os.path.exists(video_file_path):
+            try:
+                myfile = upload_video_to_gemini(client, video_file_path, subtitle.gemini_file_name)
+            except FileNotFoundError:
                 raise Exception(f"Video file not found at path: {video_file_path}")
+            if myfile.name != subtitle.gemini_file_name:
+                update_subtitle_gemini_file(subtitle_id, myfile.name)
             
-            logger.info(f"Uploading {platform} video to Gemini: {video_file_path}")
-            
-            myfile = client.files.upload(file=video_file_path)
-            logger.info(f"File uploaded - Waiting for processing... (File ID: {myfile.name})")
-            
-            while myfile.state.name == "PROCESSING":
-                logger.info("File still processing...")
-                time.sleep(2)
-                myfile = client.files.get(name=myfile.name)
-            
-            if myfile.state.name == "FAILED":
-                raise ValueError(f"File processing failed: {myfile.state}")
-            
-            logger.info(f"File is ACTIVE - Generating subtitles for {platform} video")
-            
-            response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=[myfile, SRT_PROMPT]
+            poll_subtitle_file_task.apply_async(
+                (subtitle_id,),
+                countdown=0 if myfile.state.name == "ACTIVE" else 1
             )
             
-            subtitle_text = response.text
+            return {
+                'status': 'processing',
+                'subtitle_id': subtitle_id,
+            }
         
         elif platform == 'youtube':
-            logger.info(f"Calling Gemini API for YouTube video: {video_url}")
+            logger.info("Calling Gemini API for YouTube video: %s", video_url)
             
-            response = client.models.generate_content(
+            subtitle_text = generate_srt(
+                self,
+                client,
                 model='models/gemini-2.5-flash',
                 contents=types.Content(
                     parts=[
                         types.Part(
                             file_data=types.FileData(file_uri=video_url)
                         ),
-                        types.Part(text=SRT_PROMPT)
+                        SRT_PROMPT_PART
                     ]
                 )
             )
             
-            subtitle_text = response.text
+            return complete_subtitle_generation(subtitle_id, subtitle_text)
         
         else:
             raise Exception(f"Unsupported platform: {platform}")
+    
+    except Exception as e:
+        if will_retry(self, e):
+            logger.warning("Subtitle generation task %s failed, retrying: %s", subtitle_id, e)
+            # Re-raise so autoretry_for reschedules with exponential backoff
+            raise
+        
+        logger.error("Subtitle generation task %s failed: %s", subtitle_id, e, exc_info=True)
         
-        subtitle_text.strip('```srt')
         update_subtitle_status(
             subtitle_id=subtitle_id,
-            status='completed',
-            subtitle_text=subtitle_text
+            status='failed',
+            error_message=str(e)
         )
         
-        logger.info(f"Subtitle generation task {subtitle_id} completed successfully")
+        raise
+
+
+@shared_task(bind=True, max_retries=GEMINI_FILE_POLL_MAX_RETRIES, acks_late=True)
+def poll_subtitle_file_task(self, subtitle_id: str):
+    """
+    Celery task that waits for an uploaded video to become ACTIVE in Gemini
+    and then hands it to transcribe_subtitle_file_task.
+    
+    Instead of sleeping in the worker, the task retries itself with
+    exponential backoff (1, 2, 4, ... up to GEMINI_FILE_POLL_MAX_DELAY seconds)
+    while the file is still PROCESSING.
+    
+    Args:
+        subtitle_id: UUID of the Subtitle
+    
+    Returns:
+        Dictionary with result information
+    """
+    countdown = min(2 ** self.request.retries, GEMINI_FILE_POLL_MAX_DELAY)
+    
+    subtitle = get_subtitle_by_id(subtitle_id)
+    
+    if not subtitle or not subtitle.gemini_file_name:
+        logger.error("Subtitle %s not found or has no uploaded file", subtitle_id)
+        return {'status': 'error', 'message': 'Subtitle not found'}
+    
+    try:
+        myfile = get_genai_client().files.get(name=subtitle.gemini_file_name)
+        
+        if myfile.state.name == "PROCESSING":
+            logger.info("File %s still processing, checking again in %ss", myfile.name, countdown)
+            raise self.retry(countdown=countdown)
+        
+        if myfile.state.name == "FAILED":
+            # The upload itself is unusable, so retrying the poll cannot help;
+            # upload_video_to_gemini skips FAILED files on the next generation
+            raise Exception(f"File processing failed: {myfile.state}")
+        
+        transcribe_subtitle_file_task.delay(subtitle_id)
         
         return {
-            'status': 'success',
+            'status': 'processing',
             'subtitle_id': subtitle_id,
         }
     
+    except Retry:
+        raise
+    
+    except self.MaxRetriesExceededError:
+        logger.error("File for subtitle %s still processing after %s checks", subtitle_id, self.max_retries)
+        update_subtitle_status(
+            subtitle_id=subtitle_id,
+            status='failed',
+            error_message='Timed out waiting for Gemini to process the video'
+        )
+        return {'status': 'error', 'subtitle_id': subtitle_id, 'message': 'Processing timed out'}
+    
     except Exception as e:
-        logger.error(f"Subtitle generation task {subtitle_id} failed: {str(e)}", exc_info=True)
-        
+        # A transient error checking the file uses the polling budget.
+        # retry(exc=e) re-raises e itself once retries run out, so the
+        # last attempt has to be detected up front.
+        if isinstance(e, TRANSIENT_ERRORS) and self.request.retries < self.max_retries:
+            logger.warning("Polling subtitle %s failed, retrying: %s", subtitle_id, e)
+            raise self.retry(exc=e, countdown=countdown)
+        
+        logger.error("Subtitle generation task %s failed: %s", subtitle_id, e, exc_info=True)
         update_subtitle_status(
             subtitle_id=subtitle_id,
             status='failed',
             error_message=str(e)
         )
-        
-        try:
-            raise self.retry(exc=e)
-        except self.MaxRetriesExceededError:
-            logger.error(f"Max retries exceeded for subtitle task {subtitle_id}")
-            return {
-                'status': 'error',
-                'subtitle_id': subtitle_id,
-                'message': str(e)
-            }
-
-
-TRANSLATION_PROMPT_TEMPLATE = """
-🎯 **OBJECTIVE**
-Translate the following video subtitles into **{target_language}**, producing a smooth, natural, and culturally appropriate version that feels as if it were originally written in {target_language} — while keeping the exact same SRT structure and timing.
-
----
-
-### 🧠 ROLE
-You are a professional subtitle translator and localization expert. Your goal is to create subtitles that sound authentic, natural, and emotionally accurate to native {target_language} viewers.
-
----
-
-### ⚙️ CORE REQUIREMENTS
-
-#### 1. Natural, Native-Like Translation
-- Translate ONLY the dialogue text, not the timestamps or numbering.
-- Make the translation **sound natural and conversational**, not word-for-word.
-- Adapt idioms, tone, and phrasing to what feels native in {target_language}.
-- Preserve meaning, intent, and mood — prioritize clarity and emotional accuracy over literal structure.
-- Keep cultural references understandable for {target_language} speakers.
-- Keep names, brands, and technical terms in the original language unless translation is widely known or adds clarity.
-
-#### 2. Format Preservation
-- Keep ALL timestamps EXACTLY as they are - DO NOT modify timing
-- Maintain the exact SRT structure:
-  - Sequential numbering (1, 2, 3, ...)
-  - Timestamp format: HH:MM:SS,mmm --> HH:MM:SS,mmm
-  - Blank lines between subtitle blocks
-- Keep line breaks and subtitle segmentation
-- Preserve punctuation style appropriate for {target_language}
-
-#### 3. Text Length & Readability
-- Keep translations concise and readable
-- Try to match the original text length when possible
-- If translation is longer, you may split into 2 short lines
-- Ensure subtitles remain easy to read at original timing
-
-#### 4. Output Format
-- No markdown, code fences, or explanations
-- Translate for naturalness, not literal accuracy.
-- Keep meaning, emotion, and tone intact.
-- Maintain exact SRT formatting and timestamps.
-- Output should look like a professionally translated subtitle file.
+        return {'status': 'error', 'subtitle_id': subtitle_id, 'message': str(e)}
 
----
 
-### ✅ EXAMPLE
-
-**Original (English):**
-```
-1
-00:00:00,000 --> 00:00:03,200
-Hey everyone, welcome back!
-
-2
-00:00:03,200 --> 00:00:06,800
-Today I'll show you something cool.
-```
-
-**Translated (Persian):**
-```
-1
-00:00:00,000 --> 00:00:03,200
-سلام به همه، خوش برگشتید!
-
-2
-00:00:03,200 --> 00:00:06,800
-امروز یه چیز جالب نشونتون میدم.
-```
+@shared_task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    max_retries=7,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
+)
+def transcribe_subtitle_file_task(self, subtitle_id: str):
+    """
+    Celery task to generate subtitles from a video that is ACTIVE in Gemini.
+    
+    Kept apart from poll_subtitle_file_task so that a failed transcription
+    gets the same small retry budget as generate_subtitle_task rather than
+    the much larger polling budget.
+    
+    Args:
+        subtitle_id: UUID of the Subtitle
+    
+    Returns:
+        Dictionary with result information
+    """
+    try:
+        # Selector joins content, so subtitle.content below needs no extra query
+        subtitle = get_subtitle_by_id(subtitle_id)
+        
+        if not subtitle or not subtitle.gemini_file_name:
+            logger.error("Subtitle %s not found or has no uploaded file", subtitle_id)
+            return {'status': 'error', 'message': 'Subtitle not found'}
+        
+        logger.info("File is ACTIVE - Generating subtitles for %s video", subtitle.content.platform)
+        
+        client = get_genai_client()
+        myfile = client.files.get(name=subtitle.gemini_file_name)
+        
+        subtitle_text = generate_srt(
+            self,
+            client,
+            model="gemini-2.5-flash",
+            contents=[myfile, SRT_PROMPT_PART]
+        )
+        
+        return complete_subtitle_generation(subtitle_id, subtitle_text)
+    
+    except Exception as e:
+        if will_retry(self, e):
+            logger.warning("Subtitle generation task %s failed, retrying: %s", subtitle_id, e)
+            # Re-raise so autoretry_for reschedules with exponential backoff
+            raise
+        
+        logger.error("Subtitle generation task %s failed: %s", subtitle_id, e, exc_info=True)
+        
+        update_subtitle_status(
+            subtitle_id=subtitle_id,
+            status='failed',
+            error_message=str(e)
+        )
+        
+        raise
 
----
 
-### 🧩 FINAL REMINDERS
-- ONLY translate the subtitle text, NOT the timestamps or numbers
-- Maintain the exact same SRT structure
-- Output must be clean, valid SRT format
-- Use natural, native {target_language}
+@shared_task(
+    bind=True,
+    autoretry_for=TRANSIENT_ERRORS,
+    max_retries=7,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
+)
+def translate_subtitle_task(self, subtitle_id: str, source_subtitle_id: str):
+    """
+    Celery task to translate a subtitle into another language.
+    
+    Args:
+        subtitle_id: UUID of the Subtitle receiving the translation
+        source_subtitle_id: UUID of the Subtitle to translate from
+    
+    Returns:
+        Dictionary with result information
+    """
+    logger.info("Starting subtitle translation task %s", subtitle_id)
+    
+    try:
+        subtitle = get_subtitle_by_id(subtitle_id)
+        source_subtitle = get_subtitle_by_id(source_subtitle_id)
+        
+        if not subtitle or not source_subtitle:
+            logger.error("Subtitle %s or source subtitle %s not found", subtitle_id, source_subtitle_id)
+            return {'status': 'error', 'message': 'Subtitle not found'}
+        
+        update_subtitle_status(
+            subtitle_id=subtitle_id,
+            status='generating'
+        )
+        
+        prompt = TRANSLATION_PROMPT_TEMPLATE.format(
+            target_language=subtitle.language,
+            source_subtitle_text=source_subtitle.subtitle_text
+        )
+        
+        logger.info("Calling Gemini API for subtitle translation to %s", subtitle.language)
+        
+        subtitle_text = generate_srt(
+            self,
+            get_genai_client(),
+            model="gemini-2.5-flash",
+            contents=[prompt]
+        )
+        
+        return complete_subtitle_generation(subtitle_id, subtitle_text)
+    
+    except Exception as e:
+        if will_retry(self, e):
+            logger.warning("Subtitle translation task %s failed, retrying: %s", subtitle_id, e)
+            # Re-raise so autoretry_for reschedules with exponential backoff
+            raise
+        
+        logger.error("Subtitle translation task %s failed: %s", subtitle_id, e, exc_info=True)
+        
+        update_subtitle_status(
+            subtitle_id=subtitle_id,
+            status='failed',
+            error_message=str(e)
+        )
+        
+        raise
 
----
 
-### SOURCE SUBTITLE TO TRANSLATE:
+SUBTITLE_FORCE_STYLE = (
+    "FontName=Arial,"
+    "FontSize=16,"
+    "PrimaryColour=&H00FFFFFF,"
+    "OutlineColour=&H00000000,"
+    "BorderStyle=3,"
+    "Outline=2,"
+    "Shadow=1"
+)
 
-{source_subtitle_text}
-"""
+WATERMARK_FILTER = '[1:v]format=rgba[watermark];{video}[watermark]overlay=W-w-10:H-h-10'
 
 
+def build_subtitle_filter(subtitle_file_path: str) -> str:
+    """
+    Build the ffmpeg subtitles filter for an SRT file.
+    
+    Args:
+        subtitle_file_path: Path to the SRT file
+    
+    Returns:
+        Filter string rendering the subtitles with the standard style
+    """
+    subtitle_path_escaped = subtitle_file_path.replace('\\', '/')
+    return f"subtitles={subtitle_path_escaped}:force_style='{SUBTITLE_FORCE_STYLE}'"
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -645,13 +726,14 @@ def burn_subtitle_task(self, burn_task_id: str):
     Returns:
         Dictionary with result information
     """
-    logger.info(f"Starting subtitle burn task {burn_task_id}")
+    logger.info("Starting subtitle burn task %s", burn_task_id)
     
     try:
+        # Selector joins subtitle and subtitle.content, so no extra queries below
         burn_task = get_burn_task_by_id(burn_task_id)
         
         if not burn_task:
-            logger.error(f"Burn task {burn_task_id} not found")
+            logger.error("Burn task %s not found", burn_task_id)
             return {'status': 'error', 'message': 'Burn task not found'}
         
         update_burn_task_status(
@@ -668,64 +750,30 @@ def burn_subtitle_task(self, burn_task_id: str):
         if not subtitle.subtitle_text:
             raise Exception("Subtitle text is empty")
         
-        video_file_path = os.path.join(settings.MEDIA_ROOT, content.file_path)
+        video_file_path = f"{MEDIA_ROOT}/{content.file_path}"
         
         if not os.path.exists(video_file_path):
             raise Exception(f"Video file not found at path: {video_file_path}")
         
-        subtitle_dir = os.path.join(settings.MEDIA_ROOT, 'subtitles')
-        os.makedirs(subtitle_dir, exist_ok=True)
-        
-        subtitle_filename = f"{burn_task_id}.srt"
-        subtitle_file_path = os.path.join(subtitle_dir, subtitle_filename)
-        
-        try:
-            with open(subtitle_file_path, 'w', encoding='utf-8') as f:
-                f.write(subtitle.subtitle_text)
-            
-            output_dir = os.path.join(settings.MEDIA_ROOT, 'videos', 'subtitled')
-            os.makedirs(output_dir, exist_ok=True)
+        # The SRT only has to live as long as ffmpeg runs, so keep it in memory-backed tmpfs
+        with tempfile.NamedTemporaryFile('w', suffix='.srt', dir=TMPFS_DIR, encoding='utf-8') as subtitle_file:
+            subtitle_file.write(subtitle.subtitle_text)
+            subtitle_file.flush()
+            subtitle_file_path = subtitle_file.name
             
             output_filename = f"{content.id}_{subtitle.language}.mp4"
-            output_file_path = os.path.join(output_dir, output_filename)
-    
-            subtitle_path_escaped = subtitle_file_path.replace('\\', '/')
-
-            force_style = (
-                "FontName=Arial,"
-                "FontSize=16,"
-                "PrimaryColour=&H00FFFFFF,"
-                "OutlineColour=&H00000000,"
-                "BorderStyle=3,"
-                "Outline=2,"
-                "Shadow=1"
-            )
-
-            filter_string = f"subtitles={subtitle_path_escaped}:force_style='{force_style}'"
-
-            cmd = [
-                'ffmpeg',
-                '-i', video_file_path,
-                '-vf', filter_string,
-                '-c:a', 'copy',
-                '-y',
-                output_file_path
-            ]
+            output_file_path = f"{SUBTITLED_VIDEOS_DIR}/{output_filename}"
+    
+            filter_string = build_subtitle_filter(subtitle_file_path)
 
-            logger.info(f"Running ffmpeg command: {' '.join(cmd)}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  
+            run_ffmpeg(
+                build_encode_args([video_file_path], '-vf', filter_string, output_file_path),
+                duration=get_media_duration(video_file_path),
+                on_progress=lambda progress: self.update_state(state='PROGRESS', meta={'progress': progress})
             )
             
-            if result.returncode != 0:
-                raise Exception(f"ffmpeg failed: {result.stderr}")
-            
             # Calculate relative path
-            relative_output_path = os.path.join('videos', 'subtitled', output_filename)
+            relative_output_path = f"videos/subtitled/{output_filename}"
             
             # Update content file path to point to the new video with burned subtitles
             update_content_file_path(str(content.id), relative_output_path)
@@ -736,21 +784,16 @@ def burn_subtitle_task(self, burn_task_id: str):
                 output_file_path=relative_output_path
             )
             
-            logger.info(f"Subtitle burn task {burn_task_id} completed successfully")
+            logger.info("Subtitle burn task %s completed successfully", burn_task_id)
             
             return {
                 'status': 'success',
                 'burn_task_id': burn_task_id,
                 'output_file_path': relative_output_path
             }
-        
-        finally:
-            # Clean up temporary subtitle file
-            if os.path.exists(subtitle_file_path):
-                os.remove(subtitle_file_path)
     
     except Exception as e:
-        logger.error(f"Subtitle burn task {burn_task_id} failed: {str(e)}", exc_info=True)
+        logger.error("Subtitle burn task %s failed: %s", burn_task_id, e, exc_info=True)
         
         update_burn_task_status(
             burn_task_id=burn_task_id,
@@ -761,7 +804,7 @@ def burn_subtitle_task(self, burn_task_id: str):
         try:
             raise self.retry(exc=e)
         except self.MaxRetriesExceededError:
-            logger.error(f"Max retries exceeded for burn task {burn_task_id}")
+            logger.error("Max retries exceeded for burn task %s", burn_task_id)
             return {
                 'status': 'error',
                 'burn_task_id': burn_task_id,
@@ -780,13 +823,14 @@ def burn_watermark_task(self, watermark_task_id: str):
     Returns:
         Dictionary with result information
     """
-    logger.info(f"Starting watermark burn task {watermark_task_id}")
+    logger.info("Starting watermark burn task %s", watermark_task_id)
     
     try:
+        # Selector joins content, so watermark_task.content below needs no extra query
         watermark_task = get_watermark_task_by_id(watermark_task_id)
         
         if not watermark_task:
-            logger.error(f"Watermark task {watermark_task_id} not found")
+            logger.error("Watermark task %s not found", watermark_task_id)
             return {'status': 'error', 'message': 'Watermark task not found'}
         
         update_watermark_task_status(
@@ -803,48 +847,33 @@ def burn_watermark_task(self, watermark_task_id: str):
             raise Exception("Watermark image is missing")
         
 
-        video_file_path = os.path.join(settings.MEDIA_ROOT, content.file_path)
+        video_file_path = f"{MEDIA_ROOT}/{content.file_path}"
         
         if not os.path.exists(video_file_path):
             raise Exception(f"Video file not found at path: {video_file_path}")
 
-        watermark_image_path = os.path.join(settings.MEDIA_ROOT, watermark_task.watermark_image.name)
+        watermark_image_path = f"{MEDIA_ROOT}/{watermark_task.watermark_image.name}"
         
         if not os.path.exists(watermark_image_path):
             raise Exception(f"Watermark image not found at path: {watermark_image_path}")
         
         # Create output file path
-        output_dir = os.path.join(settings.MEDIA_ROOT, 'videos', 'watermarked')
-        os.makedirs(output_dir, exist_ok=True)
-        
         output_filename = f"{content.id}_watermarked.mp4"
-        output_file_path = os.path.join(output_dir, output_filename)
-
-        cmd = [
-            'ffmpeg',
-            '-i', video_file_path,
-            '-i', watermark_image_path,
-            '-filter_complex', '[1:v]format=rgba[watermark];[0:v][watermark]overlay=W-w-10:H-h-10',
-            '-c:a', 'copy',  
-            '-y', 
-            output_file_path
-        ]
-        
-        logger.info(f"Running ffmpeg command: {' '.join(cmd)}")
-        
-        # Run ffmpeg command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minutes timeout
+        output_file_path = f"{WATERMARKED_VIDEOS_DIR}/{output_filename}"
+
+        run_ffmpeg(
+            build_encode_args(
+                [video_file_path, watermark_image_path],
+                '-filter_complex',
+                WATERMARK_FILTER.format(video='[0:v]'),
+                output_file_path
+            ),
+            duration=get_media_duration(video_file_path),
+            on_progress=lambda progress: self.update_state(state='PROGRESS', meta={'progress': progress})
         )
         
-        if result.returncode != 0:
-            raise Exception(f"ffmpeg failed: {result.stderr}")
-        
         # Calculate relative path
-        relative_output_path = os.path.join('videos', 'watermarked', output_filename)
+        relative_output_path = f"videos/watermarked/{output_filename}"
         
         # Update content file path to point to the new video with burned watermark
         update_content_file_path(str(content.id), relative_output_path)
@@ -855,7 +884,7 @@ def burn_watermark_task(self, watermark_task_id: str):
             output_file_path=relative_output_path
         )
         
-        logger.info(f"Watermark burn task {watermark_task_id} completed successfully")
+        logger.info("Watermark burn task %s completed successfully", watermark_task_id)
         
         return {
             'status': 'success',
@@ -864,7 +893,7 @@ def burn_watermark_task(self, watermark_task_id: str):
         }
     
     except Exception as e:
-        logger.error(f"Watermark burn task {watermark_task_id} failed: {str(e)}", exc_info=True)
+        logger.error("Watermark burn task %s failed: %s", watermark_task_id, e, exc_info=True)
         
         update_watermark_task_status(
             watermark_task_id=watermark_task_id,
@@ -875,10 +904,120 @@ def burn_watermark_task(self, watermark_task_id: str):
         try:
             raise self.retry(exc=e)
         except self.MaxRetriesExceededError:
-            logger.error(f"Max retries exceeded for watermark burn task {watermark_task_id}")
+            logger.error("Max retries exceeded for watermark burn task %s", watermark_task_id)
             return {
                 'status': 'error',
                 'watermark_task_id': watermark_task_id,
                 'message': str(e)
             }
 
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def burn_subtitle_and_watermark_task(self, burn_task_id: str, watermark_task_id: str):
+    """
+    Celery task to burn subtitles and a watermark into video in a single ffmpeg pass.
+    
+    Used when both are requested together, so the video is decoded and
+    encoded once instead of once per task.
+    
+    Args:
+        burn_task_id: UUID of the SubtitleBurnTask
+        watermark_task_id: UUID of the WatermarkTask
+    
+    Returns:
+        Dictionary with result information
+    """
+    logger.info("Starting subtitle and watermark burn tasks %s, %s", burn_task_id, watermark_task_id)
+    
+    def update_status(**kwargs):
+        update_burn_task_status(burn_task_id=burn_task_id, **kwargs)
+        update_watermark_task_status(watermark_task_id=watermark_task_id, **kwargs)
+    
+    try:
+        # Selectors join subtitle/content, so no extra queries below
+        burn_task = get_burn_task_by_id(burn_task_id)
+        watermark_task = get_watermark_task_by_id(watermark_task_id)
+        
+        if not burn_task or not watermark_task:
+            logger.error("Burn task %s or watermark task %s not found", burn_task_id, watermark_task_id)
+            return {'status': 'error', 'message': 'Burn task not found'}
+        
+        update_status(status='processing')
+        
+        subtitle = burn_task.subtitle
+        content = watermark_task.content
+        
+        if not content.file_path:
+            raise Exception("Video file not found")
+        
+        if not subtitle.subtitle_text:
+            raise Exception("Subtitle text is empty")
+        
+        if not watermark_task.watermark_image:
+            raise Exception("Watermark image is missing")
+        
+        video_file_path = f"{MEDIA_ROOT}/{content.file_path}"
+        
+        if not os.path.exists(video_file_path):
+            raise Exception(f"Video file not found at path: {video_file_path}")
+        
+        watermark_image_path = f"{MEDIA_ROOT}/{watermark_task.watermark_image.name}"
+        
+        if not os.path.exists(watermark_image_path):
+            raise Exception(f"Watermark image not found at path: {watermark_image_path}")
+        
+        # The SRT only has to live as long as ffmpeg runs, so keep it in memory-backed tmpfs
+        with tempfile.NamedTemporaryFile('w', suffix='.srt', dir=TMPFS_DIR, encoding='utf-8') as subtitle_file:
+            subtitle_file.write(subtitle.subtitle_text)
+            subtitle_file.flush()
+            subtitle_file_path = subtitle_file.name
+            
+            output_filename = f"{content.id}_{subtitle.language}_watermarked.mp4"
+            output_file_path = f"{WATERMARKED_VIDEOS_DIR}/{output_filename}"
+            
+            filter_string = (
+                f"[0:v]{build_subtitle_filter(subtitle_file_path)}[subtitled];"
+                f"{WATERMARK_FILTER.format(video='[subtitled]')}"
+            )
+            
+            run_ffmpeg(
+                build_encode_args(
+                    [video_file_path, watermark_image_path],
+                    '-filter_complex',
+                    filter_string,
+                    output_file_path
+                ),
+                duration=get_media_duration(video_file_path),
+                on_progress=lambda progress: self.update_state(state='PROGRESS', meta={'progress': progress})
+            )
+            
+            relative_output_path = f"videos/watermarked/{output_filename}"
+            
+            update_content_file_path(str(content.id), relative_output_path)
+            
+            update_status(status='completed', output_file_path=relative_output_path)
+            
+            logger.info("Subtitle and watermark burn tasks %s, %s completed successfully", burn_task_id, watermark_task_id)
+            
+            return {
+                'status': 'success',
+                'burn_task_id': burn_task_id,
+                'watermark_task_id': watermark_task_id,
+                'output_file_path': relative_output_path
+            }
+    
+    except Exception as e:
+        logger.error("Subtitle and watermark burn tasks %s, %s failed: %s", burn_task_id, watermark_task_id, e, exc_info=True)
+        
+        update_status(status='failed', error_message=str(e))
+        
+        try:
+            raise self.retry(exc=e)
+        except self.MaxRetriesExceededError:
+            logger.error("Max retries exceeded for burn tasks %s, %s", burn_task_id, watermark_task_id)
+            return {
+                'status': 'error',
+                'burn_task_id': burn_task_id,
+                'watermark_task_id': watermark_task_id,
+                'message': str(e)
+            }
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+
+from apps.content.serializers import (
+    ContentSerializer,
+    SubtitleBurnTaskSerializer,
+    SubtitleSerializer,
+    VideoDownloadTaskSerializer,
+    WatermarkTaskSerializer,
+)
+
+
+class OutputSerializerFieldsTests(SimpleTestCase):
+    """
+    Binding a serializer's fields runs DRF's declaration checks, such as
+    rejecting a redundant source=, which otherwise only fail at request time.
+    """
+
+    def test_fields_bind(self):
+        for serializer_class in (
+            ContentSerializer,
+            VideoDownloadTaskSerializer,
+            SubtitleSerializer,
+            SubtitleBurnTaskSerializer,
+            WatermarkTaskSerializer,
+        ):
+            with self.subTest(serializer=serializer_class.__name__):
+                self.assertTrue(serializer_class().fields)
+
+    def test_watermark_task_content_id_is_read_only(self):
+        field = WatermarkTaskSerializer().fields['content_id']
+
+        self.assertTrue(field.read_only)
+        self.assertEqual(field.source, 'content_id')
@@ -1,7 +1,7 @@
 """
 URL routing for content app.
 """
-from django.urls import path
+from django.urls import include, path
 from apps.content.views import (
     ContentCreateView,
     ContentDetailView,
@@ -21,86 +21,100 @@ from apps.content.views import (
 
 app_name = 'content'
 
-urlpatterns = [
+# Routes are grouped under their shared prefixes so the resolver skips a
+# whole group as soon as its prefix does not match
+
+content_patterns = [
     # Content Management
     path(
-        'projects/<uuid:project_id>/content/',
+        '',
         ContentDetailView.as_view(),
         name='content-detail'
     ),
     path(
-        'projects/<uuid:project_id>/content/create/',
+        'create/',
         ContentCreateView.as_view(),
         name='content-create'
     ),
     
     path(
-        'projects/<uuid:project_id>/content/delete/',
+        'delete/',
         ContentDeleteView.as_view(),
         name='content-delete'
     ),
     
     # Video Download
     path(
-        'projects/<uuid:project_id>/content/download-status/',
+        'download-status/',
         VideoDownloadStatusView.as_view(),
         name='video-download-status'
     ),
-    path(
-        'download-tasks/<uuid:task_id>/',
-        VideoDownloadTaskDetailView.as_view(),
-        name='download-task-detail'
-    ),
-    
+]
+
+subtitle_patterns = [
     # Subtitle Management
     path(
-        'projects/<uuid:project_id>/subtitles/generate/',
+        'generate/',
         SubtitleGenerateView.as_view(),
         name='subtitle-generate'
     ),
     
     path(
-        'projects/<uuid:project_id>/subtitles/',
+        '',
         SubtitleListView.as_view(),
         name='subtitle-list'
     ),
     
     path(
-        'projects/<uuid:project_id>/subtitles/<uuid:subtitle_id>/delete/',
+        '<uuid:subtitle_id>/delete/',
         SubtitleDeleteView.as_view(),
         name='subtitle-delete'
     ),
     
     path(
-        'projects/<uuid:project_id>/subtitles/translate/',
+        'translate/',
         SubtitleTranslateView.as_view(),
         name='subtitle-translate'
     ),
     
     # Subtitle Burning
     path(
-        'projects/<uuid:project_id>/subtitles/<uuid:subtitle_id>/burn/',
+        '<uuid:subtitle_id>/burn/',
         SubtitleBurnView.as_view(),
         name='subtitle-burn'
     ),
+]
+
+project_patterns = [
+    path('content/', include(content_patterns)),
+    path('subtitles/', include(subtitle_patterns)),
     
     path(
-        'projects/<uuid:project_id>/burn-tasks/<uuid:burn_task_id>/',
+        'burn-tasks/<uuid:burn_task_id>/',
         SubtitleBurnStatusView.as_view(),
         name='subtitle-burn-status'
     ),
     
     # Watermark
     path(
-        'projects/<uuid:project_id>/watermark/',
+        'watermark/',
         WatermarkCreateView.as_view(),
         name='watermark-create'
     ),
     
     path(
-        'projects/<uuid:project_id>/watermark-tasks/<uuid:watermark_task_id>/',
+        'watermark-tasks/<uuid:watermark_task_id>/',
         WatermarkStatusView.as_view(),
         name='watermark-status'
     ),
 ]
 
+urlpatterns = [
+    path('projects/<uuid:project_id>/', include(project_patterns)),
+    
+    path(
+        'download-tasks/<uuid:task_id>/',
+        VideoDownloadTaskDetailView.as_view(),
+        name='download-task-detail'
+    ),
+]
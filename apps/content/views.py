@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 
 from apps.content.serializers import (
     ContentSerializer,
@@ -22,22 +23,22 @@ from apps.content.services import (
     create_content_from_search_result, 
     delete_content, 
     create_subtitle_generation_task,
-    translate_subtitle_synchronous,
+    create_subtitle_translation_task,
     create_subtitle_burn_task,
     delete_subtitle,
     create_watermark_task,
 )
 from apps.content.selectors import (
-    get_download_task_by_id, 
-    get_project_content, 
+    get_download_task_for_owner,
+    get_project_with_content,
+    project_has_content,
     get_subtitle_by_content,
-    get_subtitle_by_id,
+    get_subtitle_for_owner,
     list_subtitles_by_content,
-    get_burn_task_by_id,
-    get_watermark_task_by_id,
+    get_burn_task_for_owner,
+    get_watermark_task_for_owner,
 )
-from apps.search.selectors import get_project_by_id
-from apps.search.models import SearchResult
+from apps.search.selectors import get_search_result_for_project
 from apps.content.schemas import (
     content_create_schema,
     content_detail_schema,
@@ -56,6 +57,12 @@ from apps.content.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Polled status views share one serializer each, so the ModelSerializer field
+# set is built once per process. Only to_representation() is called on them,
+# which keeps no per-request state.
+download_task_serializer = VideoDownloadTaskSerializer()
+burn_task_serializer = SubtitleBurnTaskSerializer()
+
 
 class ContentCreateView(APIView):
     """
@@ -70,39 +77,28 @@ class ContentCreateView(APIView):
 
     @content_create_schema
     def post(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        if hasattr(project, 'content'):
+        if project_has_content(project):
             return Response(
                 {"error": "Content already exists for this project."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
         search_result_id = serializer.validated_data['search_result_id']
         
-        try:
-            search_result = SearchResult.objects.select_related('search_request__project').get(
-                id=search_result_id
-            )
-
-            if search_result.search_request.project_id != project.id:
-                return Response(
-                    {"error": "Search result does not belong to this project."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-        except SearchResult.DoesNotExist:
+        search_result = get_search_result_for_project(project, search_result_id)
+        if not search_result:
             return Response(
-                {"error": "Search result not found."},
+                {"error": "Search result not found in this project."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
@@ -128,14 +124,14 @@ class ContentDetailView(APIView):
 
     @content_detail_schema
     def get(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -152,25 +148,25 @@ class VideoDownloadStatusView(APIView):
     """
     
     permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer]
     serializer_class = VideoDownloadTaskSerializer
     
     @video_download_status_schema
     def get(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)        
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        if not hasattr(project, 'content'):
+        content = getattr(project, 'content', None)
+        if not content:
             return Response(
                 {"error": "No content found for this project."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = project.content
-        
         if content.content_type != 'video':
             return Response(
                 {"error": "Content is not a video."},
@@ -178,8 +174,7 @@ class VideoDownloadStatusView(APIView):
             )
         
         download_task = content.download_task
-        serializer = self.serializer_class(download_task)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(download_task_serializer.to_representation(download_task), status=status.HTTP_200_OK)
         
 
 class VideoDownloadTaskDetailView(APIView):
@@ -188,27 +183,20 @@ class VideoDownloadTaskDetailView(APIView):
     """
     
     permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer]
     serializer_class = VideoDownloadTaskSerializer
     
     @video_download_task_detail_schema
     def get(self, request, task_id):
-        download_task = get_download_task_by_id(task_id)
+        download_task = get_download_task_for_owner(owner_id=request.user.id, task_id=task_id)
 
         if not download_task:
             return Response(
-                {"error": "Download task not found."},
+                {"error": "Download task not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        project = download_task.content.project
-        if project.owner_id != request.user.id:
-            return Response(
-                {"error": "Access denied."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        serializer = self.serializer_class(download_task)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(download_task_serializer.to_representation(download_task), status=status.HTTP_200_OK)
 
 
 class ContentDeleteView(APIView):
@@ -220,14 +208,14 @@ class ContentDeleteView(APIView):
     
     @content_delete_schema
     def delete(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -236,7 +224,7 @@ class ContentDeleteView(APIView):
         
         delete_content(content)
         
-        logger.info(f"User {request.user.id} deleted content for project {project_id}")
+        logger.info("User %s deleted content for project %s", request.user.id, project_id)
         
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -251,14 +239,14 @@ class SubtitleGenerateView(APIView):
     
     @subtitle_generate_schema
     def post(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -293,7 +281,7 @@ class SubtitleGenerateView(APIView):
         
         serializer = self.serializer_class(subtitle)
         
-        logger.info(f"User {request.user.id} initiated subtitle generation for project {project_id}")
+        logger.info("User %s initiated subtitle generation for project %s", request.user.id, project_id)
         
         return Response(
             serializer.data,
@@ -311,14 +299,14 @@ class SubtitleListView(APIView):
     
     @subtitle_list_schema
     def get(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -346,37 +334,23 @@ class SubtitleDeleteView(APIView):
     
     @subtitle_delete_schema
     def delete(self, request, project_id, subtitle_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
-        if not project:
-            return Response(
-                {"error": "Project not found or access denied."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        
-        subtitle = get_subtitle_by_id(subtitle_id)
+        subtitle = get_subtitle_for_owner(owner_id=request.user.id, project_id=project_id, subtitle_id=subtitle_id)
         if not subtitle:
             return Response(
-                {"error": "Subtitle not found."},
+                {"error": "Subtitle not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        # Verify subtitle belongs to this project
-        if subtitle.content.project_id != project.id:
-            return Response(
-                {"error": "Subtitle does not belong to this project."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
         delete_subtitle(subtitle)
         
-        logger.info(f"User {request.user.id} deleted subtitle {subtitle_id} for project {project_id}")
+        logger.info("User %s deleted subtitle %s for project %s", request.user.id, subtitle_id, project_id)
         
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class SubtitleTranslateView(APIView):
     """
-    POST: Translate a subtitle to a different language using AI (synchronous).
+    POST: Start translating a subtitle to a different language using AI.
     """
     
     permission_classes = [IsAuthenticated]
@@ -384,14 +358,17 @@ class SubtitleTranslateView(APIView):
     
     @subtitle_translate_schema
     def post(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -404,49 +381,35 @@ class SubtitleTranslateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
         source_subtitle_id = serializer.validated_data['source_subtitle_id']
         target_language = serializer.validated_data['target_language']
         
-        source_subtitle = get_subtitle_by_id(str(source_subtitle_id))
+        source_subtitle = get_subtitle_for_owner(
+            owner_id=request.user.id,
+            project_id=project.id,
+            subtitle_id=source_subtitle_id
+        )
         if not source_subtitle:
             return Response(
-                {"error": "Source subtitle not found."},
+                {"error": "Source subtitle not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        # Verify source subtitle belongs to this project
-        if source_subtitle.content.project_id != project.id:
-            return Response(
-                {"error": "Source subtitle does not belong to this project."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
         try:
-            # Perform translation synchronously
-            translated_subtitle = translate_subtitle_synchronous(source_subtitle, target_language)
+            translated_subtitle = create_subtitle_translation_task(source_subtitle, target_language)
         except ValueError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        except Exception as e:
-            logger.error(f"Translation failed for project {project_id}: {str(e)}", exc_info=True)
-            return Response(
-                {"error": f"Translation failed: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
         
         response_serializer = SubtitleSerializer(translated_subtitle)
         
-        logger.info(f"User {request.user.id} completed subtitle translation to {target_language} for project {project_id}")
+        logger.info("User %s initiated subtitle translation to %s for project %s", request.user.id, target_language, project_id)
         
         return Response(
             response_serializer.data,
-            status=status.HTTP_200_OK
+            status=status.HTTP_201_CREATED
         )
 
 
@@ -460,27 +423,13 @@ class SubtitleBurnView(APIView):
     
     @subtitle_burn_schema
     def post(self, request, project_id, subtitle_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
-        if not project:
-            return Response(
-                {"error": "Project not found or access denied."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        
-        subtitle = get_subtitle_by_id(subtitle_id)
+        subtitle = get_subtitle_for_owner(owner_id=request.user.id, project_id=project_id, subtitle_id=subtitle_id)
         if not subtitle:
             return Response(
-                {"error": "Subtitle not found."},
+                {"error": "Subtitle not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        # Verify subtitle belongs to this project
-        if subtitle.content.project_id != project.id:
-            return Response(
-                {"error": "Subtitle does not belong to this project."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
         try:
             burn_task = create_subtitle_burn_task(subtitle)
         except ValueError as e:
@@ -491,7 +440,7 @@ class SubtitleBurnView(APIView):
         
         serializer = self.serializer_class(burn_task)
         
-        logger.info(f"User {request.user.id} initiated subtitle burn task for subtitle {subtitle_id}")
+        logger.info("User %s initiated subtitle burn task for subtitle %s", request.user.id, subtitle_id)
         
         return Response(
             serializer.data,
@@ -505,33 +454,19 @@ class SubtitleBurnStatusView(APIView):
     """
     
     permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer]
     serializer_class = SubtitleBurnTaskSerializer
     
     @subtitle_burn_status_schema
     def get(self, request, project_id, burn_task_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
-        if not project:
-            return Response(
-                {"error": "Project not found or access denied."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        
-        burn_task = get_burn_task_by_id(burn_task_id)
+        burn_task = get_burn_task_for_owner(owner_id=request.user.id, project_id=project_id, burn_task_id=burn_task_id)
         if not burn_task:
             return Response(
-                {"error": "Burn task not found."},
+                {"error": "Burn task not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        # Verify burn task belongs to this project
-        if burn_task.subtitle.content.project_id != project.id:
-            return Response(
-                {"error": "Burn task does not belong to this project."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
-        serializer = self.serializer_class(burn_task)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(burn_task_serializer.to_representation(burn_task), status=status.HTTP_200_OK)
 
 
 class WatermarkCreateView(APIView):
@@ -544,14 +479,17 @@ class WatermarkCreateView(APIView):
     
     @watermark_create_schema
     def post(self, request, project_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        content = get_project_content(project)
+        content = getattr(project, 'content', None)
         if not content:
             return Response(
                 {"error": "No content found for this project."},
@@ -564,26 +502,35 @@ class WatermarkCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        serializer = self.serializer_class(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
         watermark_image = serializer.validated_data['watermark_image']
         
+        subtitle = None
+        subtitle_id = serializer.validated_data.get('subtitle_id')
+        if subtitle_id:
+            subtitle = get_subtitle_for_owner(owner_id=request.user.id, project_id=project.id, subtitle_id=subtitle_id)
+            if not subtitle:
+                return Response(
+                    {"error": "Subtitle not found or access denied."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+        
         try:
-            watermark_task = create_watermark_task(content, watermark_image)
+            watermark_task, burn_task = create_watermark_task(content, watermark_image, subtitle=subtitle)
         except ValueError as e:
             return Response(
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        response_serializer = WatermarkTaskSerializer(watermark_task, context={'request': request})
+        response_data = WatermarkTaskSerializer(watermark_task, context={'request': request}).data
+        if burn_task:
+            # Lets the client follow the fused job from the burn task endpoint too
+            response_data['burn_task_id'] = str(burn_task.id)
         
-        logger.info(f"User {request.user.id} initiated watermark burn task for project {project_id}")
+        logger.info("User %s initiated watermark burn task for project %s", request.user.id, project_id)
         
         return Response(
-            response_serializer.data,
+            response_data,
             status=status.HTTP_201_CREATED
         )
 
@@ -594,30 +541,21 @@ class WatermarkStatusView(APIView):
     """
     
     permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer]
     serializer_class = WatermarkTaskSerializer
     
     @watermark_status_schema
     def get(self, request, project_id, watermark_task_id):
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
-        if not project:
-            return Response(
-                {"error": "Project not found or access denied."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        
-        watermark_task = get_watermark_task_by_id(watermark_task_id)
+        watermark_task = get_watermark_task_for_owner(
+            owner_id=request.user.id,
+            project_id=project_id,
+            watermark_task_id=watermark_task_id
+        )
         if not watermark_task:
             return Response(
-                {"error": "Watermark task not found."},
+                {"error": "Watermark task not found or access denied."},
                 status=status.HTTP_404_NOT_FOUND,
             )
         
-        # Verify watermark task belongs to this project
-        if watermark_task.content.project_id != project.id:
-            return Response(
-                {"error": "Watermark task does not belong to this project."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
         serializer = self.serializer_class(watermark_task, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.2 on 2026-10-16 12:40
+
+import apps.copywriting.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('copywriting', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='copywritingsession',
+            name='edits',
+            field=apps.copywriting.models.OrjsonJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='copywritingsession',
+            name='inputs',
+            field=apps.copywriting.models.OrjsonJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='copywritingsession',
+            name='outputs',
+            field=apps.copywriting.models.OrjsonJSONField(blank=True, default=dict),
+        ),
+    ]
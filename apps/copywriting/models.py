@@ -1,8 +1,28 @@
 import uuid
+import orjson
 from django.db import models
 from apps.search.models import Project
 
 
+class OrjsonJSONField(models.JSONField):
+    """
+    JSONField that decodes values read from the database with orjson.
+    
+    Writes still go through Django's JSON adapter, so stored data is unchanged.
+    """
+    
+    def from_db_value(self, value, expression, connection):
+        # Key transforms on some backends return already-decoded values
+        if not isinstance(value, (str, bytes)):
+            return value
+        
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson rejects some valid JSON, e.g. integers wider than 64 bits
+            return super().from_db_value(value, expression, connection)
+
+
 class CopywritingSession(models.Model):
     """
     Model to store AI-generated marketing copy for projects.
@@ -18,9 +38,9 @@ class CopywritingSession(models.Model):
         on_delete=models.CASCADE,
         related_name='copywriting_sessions'
     )
-    inputs = models.JSONField(default=dict, blank=True)
-    outputs = models.JSONField(default=dict, blank=True)
-    edits = models.JSONField(default=dict, blank=True)
+    inputs = OrjsonJSONField(default=dict, blank=True)
+    outputs = OrjsonJSONField(default=dict, blank=True)
+    edits = OrjsonJSONField(default=dict, blank=True)
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -50,6 +70,4 @@ class CopywritingSession(models.Model):
         
         edits = self.edits if isinstance(self.edits, dict) else {}
         
-        final = outputs.copy()
-        final.update(edits)
-        return final
+        return {**outputs, **edits}
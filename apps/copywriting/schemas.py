@@ -17,6 +17,17 @@ from apps.copywriting.serializers import (
 )
 
 
+# A fresh session has no edits, so its outputs and final_outputs are the same
+GENERATED_OUTPUTS_EXAMPLE = {
+    'title': 'عنوان جذاب برای پروژه',
+    'caption': 'متن تبلیغاتی کامل...',
+    'micro_caption': 'متن کوتاه',
+    'meta_description': 'توضیحات متا',
+    'hashtags': ['#تگ1', '#تگ2'],
+    'cta': 'همین حالا ببینید',
+    'alt_text': 'متن جایگزین',
+}
+
 
 copywriting_generate_schema = extend_schema(
     operation_id='generate_copywriting',
@@ -53,25 +64,9 @@ copywriting_generate_schema = extend_schema(
                             'platform': 'instagram',
                             'user_description': 'Make it engaging',
                         },
-                        'outputs': {
-                            'title': 'عنوان جذاب برای پروژه',
-                            'caption': 'متن تبلیغاتی کامل...',
-                            'micro_caption': 'متن کوتاه',
-                            'meta_description': 'توضیحات متا',
-                            'hashtags': ['#تگ1', '#تگ2'],
-                            'cta': 'همین حالا ببینید',
-                            'alt_text': 'متن جایگزین',
-                        },
+                        'outputs': GENERATED_OUTPUTS_EXAMPLE,
                         'edits': {},
-                        'final_outputs': {
-                            'title': 'عنوان جذاب برای پروژه',
-                            'caption': 'متن تبلیغاتی کامل...',
-                            'micro_caption': 'متن کوتاه',
-                            'meta_description': 'توضیحات متا',
-                            'hashtags': ['#تگ1', '#تگ2'],
-                            'cta': 'همین حالا ببینید',
-                            'alt_text': 'متن جایگزین',
-                        },
+                        'final_outputs': GENERATED_OUTPUTS_EXAMPLE,
                         'status': 'pending',
                         'created_at': '2024-01-15T12:00:00Z',
                         'updated_at': '2024-01-15T12:00:00Z',
@@ -293,7 +288,11 @@ copywriting_regenerate_section_schema = extend_schema(
     description=(
         'Regenerate a specific section of copywriting using AI with custom instructions. '
         'The AI will consider the current value, project context, and your instructions '
-        'to generate a new version of the section.'
+        'to generate a new version of the section.\n\n'
+        'Set `stream` to true to receive the new text as server-sent events '
+        '(`text/event-stream`) while it is generated: `chunk` events carry text, '
+        'followed by a single `done` or `error` event. The section is saved once '
+        'generation finishes.'
     ),
     tags=['Copywriting'],
     request=RegenerateSectionSerializer,
@@ -17,7 +17,7 @@ def list_copywriting_sessions_for_project(project: Project) -> QuerySet[Copywrit
     Returns:
         QuerySet of CopywritingSession instances
     """
-    return CopywritingSession.objects.select_related('project').filter(project=project)
+    return CopywritingSession.objects.filter(project=project)
 
 
 def get_copywriting_session_by_id(
@@ -34,11 +34,11 @@ def get_copywriting_session_by_id(
     Returns:
         CopywritingSession instance or None if not found
     """
-    return (
-        CopywritingSession.objects.select_related('project')
-        .filter(id=session_id, project=project)
-        .first()
-    )
+    session = CopywritingSession.objects.filter(id=session_id, project=project).first()
+    if session:
+        # The caller already holds the project, so reuse it instead of joining it
+        session.project = project
+    return session
 
 
 def get_latest_copywriting_session_for_project(project: Project) -> Optional[CopywritingSession]:
@@ -51,10 +51,8 @@ def get_latest_copywriting_session_for_project(project: Project) -> Optional[Cop
     Returns:
         CopywritingSession instance or None if not found
     """
-    return (
-        CopywritingSession.objects.select_related('project')
-        .filter(project=project)
-        .order_by('-created_at')
-        .first()
-    )
+    session = CopywritingSession.objects.filter(project=project).order_by('-created_at').first()
+    if session:
+        session.project = project
+    return session
 
@@ -68,6 +68,11 @@ class RegenerateSectionSerializer(serializers.Serializer):
         required=True,
         help_text='Instructions for how to regenerate the section'
     )
+    stream = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text='Stream the new text as server-sent events while it is generated'
+    )
 
 
 class SaveFinalSerializer(serializers.Serializer):
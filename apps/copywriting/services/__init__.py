@@ -2,20 +2,49 @@
 Business logic services for copywriting operations.
 """
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 from django.db import transaction
+from django.db.models import F, Func, JSONField, Value
+from django.utils import timezone
 
-from apps.content.selectors import get_project_content
+from apps.content.selectors import get_preferred_completed_subtitle, get_project_content
 from apps.copywriting.models import CopywritingSession
-from apps.copywriting.services.ai_client import generate_copywriting, regenerate_section
+from apps.copywriting.services.ai_client import (
+    generate_copywriting,
+    regenerate_section,
+    stream_regenerate_section,
+)
 from apps.search.models import Project
 from apps.search.selectors import list_search_results_for_project
 
 logger = logging.getLogger(__name__)
 
+# Subtitle languages to give the copywriter as context, most preferred first
+SUBTITLE_PREFERRED_LANGUAGES = ['original', 'persian', 'english']
+
+
+def _set_json_key(field_name: str, key: str, value) -> Func:
+    """
+    Build an expression that sets one top-level key of a jsonb column in the database.
+    
+    Args:
+        field_name: Name of the JSONField to update
+        key: Key to set
+        value: JSON-serializable value for the key
+    
+    Returns:
+        Expression usable in QuerySet.update()
+    """
+    return Func(
+        F(field_name),
+        Value({key: value}, output_field=JSONField()),
+        template='(%(expressions)s)',
+        arg_joiner=' || ',
+        output_field=JSONField(),
+    )
+
 
-@transaction.atomic
 def create_copywriting_session(
     *,
     project: Project,
@@ -24,6 +53,9 @@ def create_copywriting_session(
     """
     Create a new copywriting session and generate content using AI.
     
+    Runs outside a transaction so no database connection is held open during
+    the AI call; the session is written with a single INSERT afterwards.
+    
     Args:
         project: The project to generate copywriting for
         user_description: Optional user note or description
@@ -45,23 +77,10 @@ def create_copywriting_session(
         inputs['source_url'] = content.source_url
         inputs['content_type'] = content.content_type
         
-        completed_subtitles = list(
-            content.subtitles.filter(status='completed').order_by('-created_at')
-        )
-        preferred_languages = ['original', 'persian', 'english']
-        selected_subtitle = next(
-            (
-                subtitle for language in preferred_languages
-                for subtitle in completed_subtitles
-                if subtitle.language == language and subtitle.subtitle_text
-            ),
-            None,
+        selected_subtitle = get_preferred_completed_subtitle(
+            content,
+            preferred_languages=SUBTITLE_PREFERRED_LANGUAGES
         )
-        if not selected_subtitle:
-            selected_subtitle = next(
-                (subtitle for subtitle in completed_subtitles if subtitle.subtitle_text),
-                None,
-            )
         
         if selected_subtitle:
             inputs['subtitle'] = selected_subtitle.subtitle_text
@@ -72,22 +91,17 @@ def create_copywriting_session(
                 project.id,
             )
     
-    selected_results = list_search_results_for_project(project, only_selected=True)
-    search_results_data = []
-    for result in selected_results:
-        search_results_data.append({
-            'title': result.title,
-            'snippet': result.snippet,
-            'link': result.link,
-        })
+    search_results_data = list(
+        list_search_results_for_project(project, only_selected=True).values('title', 'snippet', 'link')
+    )
     
-    logger.info(f"Found {len(search_results_data)} selected search results for project {project.id}")
+    logger.info("Found %s selected search results for project %s", len(search_results_data), project.id)
     
     outputs = generate_copywriting(inputs, search_results=search_results_data if search_results_data else None)
     
     # Ensure outputs is a dict before storing
     if not isinstance(outputs, dict):
-        logger.error(f"Invalid outputs type: {type(outputs)}. Using empty dict.")
+        logger.error("Invalid outputs type: %s. Using empty dict.", type(outputs))
         outputs = {}
     
     session = CopywritingSession.objects.create(
@@ -97,7 +111,7 @@ def create_copywriting_session(
         status='pending',
     )
     
-    logger.info(f"Created copywriting session {session.id} for project {project.id}")
+    logger.info("Created copywriting session %s for project %s", session.id, project.id)
     
     return session
 
@@ -120,18 +134,20 @@ def update_session_edit(
     Returns:
         Updated CopywritingSession instance
     """
-    # Update edits field
-    edits = session.edits.copy()
-    edits[section] = new_value
-    session.edits = edits
-    session.save(update_fields=['edits', 'updated_at'])
+    # Merge the edit into the stored edits so concurrent edits to other sections are kept
+    updated_at = timezone.now()
+    CopywritingSession.objects.filter(pk=session.pk).update(
+        edits=_set_json_key('edits', section, new_value),
+        updated_at=updated_at
+    )
+    session.edits[section] = new_value
+    session.updated_at = updated_at
     
-    logger.info(f"Updated session {session.id} section '{section}' with manual edit")
+    logger.info("Updated session %s section '%s' with manual edit", session.id, section)
     
     return session
 
 
-@transaction.atomic
 def regenerate_session_section(
     *,
     session: CopywritingSession,
@@ -141,6 +157,9 @@ def regenerate_session_section(
     """
     Regenerate a specific section using AI.
     
+    Runs outside a transaction so no database connection is held open during
+    the AI call; the new value is written with a single UPDATE afterwards.
+    
     Args:
         session: The copywriting session to update
         section: Section name to regenerate
@@ -149,35 +168,91 @@ def regenerate_session_section(
     Returns:
         Tuple of (updated session, new section value)
     """
+    # Regenerate section using AI
+    new_value = regenerate_section(
+        context=_build_regenerate_context(session, section),
+        section=section,
+        instruction=instruction,
+    )
+    
+    _save_regenerated_section(session, section, new_value)
+    
+    return session, new_value
+
+
+def stream_regenerate_session_section(
+    *,
+    session: CopywritingSession,
+    section: str,
+    instruction: str
+) -> Iterator[str]:
+    """
+    Regenerate a specific section using AI, yielding the new text as it is generated.
+    
+    The new value is saved once the model has finished. Nothing is saved if
+    generation fails or the caller stops iterating early.
+    
+    Args:
+        session: The copywriting session to update
+        section: Section name to regenerate
+        instruction: User instruction for regeneration
+    
+    Yields:
+        Chunks of the new section value
+    """
+    chunks = []
+    for chunk in stream_regenerate_section(
+        context=_build_regenerate_context(session, section),
+        section=section,
+        instruction=instruction,
+    ):
+        chunks.append(chunk)
+        yield chunk
+    
+    _save_regenerated_section(session, section, ''.join(chunks).strip())
+
+
+def _build_regenerate_context(session: CopywritingSession, section: str) -> dict:
+    """
+    Build the project context the AI needs to regenerate a section.
+    
+    Args:
+        session: The copywriting session being regenerated
+        section: Section name to regenerate
+    
+    Returns:
+        Context dictionary for the regeneration prompt
+    """
     # Get current value (from edits if exists, otherwise from outputs)
     final_outputs = session.get_final_outputs()
-    old_value = final_outputs.get(section, '')
     
-    # Prepare context for regeneration
-    context = {
+    return {
         'title': session.inputs.get('title', ''),
         'description': session.inputs.get('description', ''),
         'subtitle': session.inputs.get('subtitle', ''),
         'subtitle_language': session.inputs.get('subtitle_language', ''),
-        'old_value': old_value,
+        'old_value': final_outputs.get(section, ''),
     }
+
+
+def _save_regenerated_section(session: CopywritingSession, section: str, new_value: str) -> None:
+    """
+    Store a regenerated section in the session outputs (not edits).
     
-    # Regenerate section using AI
-    new_value = regenerate_section(
-        context=context,
-        section=section,
-        instruction=instruction,
+    Args:
+        session: The copywriting session to update
+        section: Section name that was regenerated
+        new_value: New value for the section
+    """
+    updated_at = timezone.now()
+    CopywritingSession.objects.filter(pk=session.pk).update(
+        outputs=_set_json_key('outputs', section, new_value),
+        updated_at=updated_at
     )
+    session.outputs[section] = new_value
+    session.updated_at = updated_at
     
-    # Update outputs field (not edits)
-    outputs = session.outputs.copy()
-    outputs[section] = new_value
-    session.outputs = outputs
-    session.save(update_fields=['outputs', 'updated_at'])
-    
-    logger.info(f"Regenerated session {session.id} section '{section}'")
-    
-    return session, new_value
+    logger.info("Regenerated session %s section '%s'", session.id, section)
 
 
 @transaction.atomic
@@ -198,7 +273,7 @@ def finalize_session(*, session: CopywritingSession) -> dict:
     session.status = 'completed'
     session.save(update_fields=['status', 'updated_at'])
     
-    logger.info(f"Finalized session {session.id}")
+    logger.info("Finalized session %s", session.id)
     
     return final_outputs
 
@@ -1,11 +1,14 @@
 """
 AI client for generating copywriting using Google Generative AI.
 """
+import hashlib
 import json
 import logging
-from typing import Dict, Optional
+import threading
+from typing import Dict, Iterator, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 from google import genai
 from google.genai import types
 
@@ -17,19 +20,33 @@ from apps.copywriting.services.prompts import (
 
 logger = logging.getLogger(__name__)
 
+GENERATION_CACHE_PREFIX = 'copywriting_generation:'
+
+_client = None
+_client_lock = threading.Lock()
+
 
 def get_client():
     """
-    Get configured GenAI client instance.
+    Get the process-wide GenAI client instance, creating it on first use.
     This can be easily swapped with other LLM providers.
+    
+    Sharing one client lets every request reuse its HTTP connection pool.
     """
+    global _client
+    
     api_key = settings.GEMINI_API_KEY
 
     if not api_key:
         logger.warning("GEMINI_API_KEY not configured. Using mock responses.")
         return None
     
-    return genai.Client(api_key=api_key)
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = genai.Client(api_key=api_key)
+    
+    return _client
 
 
 def get_generation_config(response_format: str = "text") -> types.GenerateContentConfig:
@@ -85,10 +102,64 @@ def call_llm(prompt: str, response_format: str = "text") -> str:
     return response.text
 
 
+def stream_llm(prompt: str) -> Iterator[str]:
+    """
+    Make a streaming call to the LLM, yielding text as it is generated.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+    
+    Yields:
+        Chunks of the response text
+    
+    Raises:
+        Exception: If the LLM call fails
+    """
+    client = get_client()
+    
+    if not client:
+        raise Exception("AI client not configured. Please set GEMINI_API_KEY.")
+    
+    for chunk in client.models.generate_content_stream(
+        model=settings.GEMINI_MODEL_NAME,
+        contents=prompt,
+        config=get_generation_config("text"),
+    ):
+        if chunk.text:
+            yield chunk.text
+
+
+def get_generation_cache_key(prompt: str) -> str:
+    """
+    Build the cache key under which the copywriting generated for a prompt is stored.
+    
+    The key is a fingerprint of the prompt, the model and the generation
+    settings, so changing any of them produces fresh copy.
+    
+    Args:
+        prompt: The full generation prompt
+    
+    Returns:
+        Cache key for the generated outputs
+    """
+    fingerprint = hashlib.sha256(
+        (
+            f"{settings.GEMINI_MODEL_NAME}:{settings.GEMINI_TEMPERATURE}:{settings.GEMINI_TOP_P}:"
+            f"{settings.GEMINI_TOP_K}:{settings.GEMINI_MAX_OUTPUT_TOKENS}\n{prompt}"
+        ).encode()
+    ).hexdigest()
+    return f"{GENERATION_CACHE_PREFIX}{fingerprint}"
+
+
 def generate_copywriting(inputs: dict, search_results: Optional[list] = None) -> dict:
     """
     Send structured prompt to LLM and return JSON output.
     
+    When COPYWRITING_GENERATION_CACHE_TIMEOUT is set, identical inputs return
+    the earlier copy for that many seconds instead of a new take. The cache
+    is the default Django cache, which is per process unless a shared backend
+    is configured.
+    
     Args:
         inputs: Dictionary containing:
             - title: Project title
@@ -103,6 +174,16 @@ def generate_copywriting(inputs: dict, search_results: Optional[list] = None) ->
         Dictionary with generated copywriting sections
     """
     prompt = build_generate_copywriting_prompt(inputs, search_results)
+    
+    # The prompt embeds every input, so identical prompts can reuse earlier copy
+    cache_timeout = settings.COPYWRITING_GENERATION_CACHE_TIMEOUT
+    cache_key = get_generation_cache_key(prompt) if cache_timeout else None
+    if cache_key:
+        cached_outputs = cache.get(cache_key)
+        if cached_outputs is not None:
+            logger.info("Using cached copywriting for %s", inputs.get('title'))
+            return cached_outputs
+    
     result = call_llm(prompt, response_format="json").strip()
     
     # Clean up markdown code blocks if present
@@ -114,7 +195,7 @@ def generate_copywriting(inputs: dict, search_results: Optional[list] = None) ->
     outputs = json.loads(result)
     
     if isinstance(outputs, list):
-        logger.error(f"LLM returned a list instead of dict. Converting to dict format.")
+        logger.error("LLM returned a list instead of dict. Converting to dict format.")
         if outputs and isinstance(outputs[0], dict):
             outputs = outputs[0]
         else:
@@ -123,7 +204,10 @@ def generate_copywriting(inputs: dict, search_results: Optional[list] = None) ->
     if not isinstance(outputs, dict):
         raise ValueError(f"LLM returned invalid type: {type(outputs)}. Expected dictionary.")
     
-    logger.info(f"Successfully generated copywriting for {inputs.get('title')}")
+    if cache_key:
+        cache.set(cache_key, outputs, cache_timeout)
+    
+    logger.info("Successfully generated copywriting for %s", inputs.get('title'))
     return outputs
 
 
@@ -148,10 +232,29 @@ def regenerate_section(context: dict, section: str, instruction: str) -> str:
     
     try:
         result = call_llm(prompt, response_format="text")
-        logger.info(f"Successfully regenerated section: {section}")
+        logger.info("Successfully regenerated section: %s", section)
         return result.strip()
         
     except Exception as e:
-        logger.error(f"Error regenerating section: {e}")
+        logger.error("Error regenerating section: %s", e)
         return f"[Error regenerating {section}]: {str(e)}"
 
+
+
+def stream_regenerate_section(context: dict, section: str, instruction: str) -> Iterator[str]:
+    """
+    Send partial prompt for regeneration and yield the new text as it is generated.
+    
+    Unlike regenerate_section, errors are raised rather than returned as text,
+    since part of the response may already have been sent.
+    
+    Args:
+        context: Project context, as for regenerate_section
+        section: Section name to regenerate
+        instruction: User instruction for regeneration
+    
+    Yields:
+        Chunks of the new text for the section
+    """
+    prompt = build_regenerate_section_prompt(context, section, instruction)
+    yield from stream_llm(prompt)
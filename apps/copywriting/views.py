@@ -1,4 +1,5 @@
 import logging
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -15,6 +16,7 @@ from apps.copywriting.services import (
     create_copywriting_session,
     update_session_edit,
     regenerate_session_section,
+    stream_regenerate_session_section,
     finalize_session,
 )
 from apps.copywriting.selectors import get_copywriting_session_by_id
@@ -25,11 +27,27 @@ from apps.copywriting.schemas import (
     copywriting_regenerate_section_schema,
     copywriting_save_final_schema,
 )
+from apps.content.selectors import get_project_with_content
 from apps.search.selectors import get_project_by_id
 
 logger = logging.getLogger(__name__)
 
 
+def format_sse_event(event: str, data: str) -> str:
+    """
+    Format a server-sent event, splitting multi-line data into data lines.
+    
+    Args:
+        event: Event name
+        data: Event payload
+    
+    Returns:
+        The encoded event, terminated by a blank line
+    """
+    lines = ''.join(f"data: {line}\n" for line in data.split('\n'))
+    return f"event: {event}\n{lines}\n"
+
+
 class CopywritingGenerateView(APIView):
     """
     POST: Generate AI copywriting for a project
@@ -41,7 +59,7 @@ class CopywritingGenerateView(APIView):
     @copywriting_generate_schema
     def post(self, request, project_id):
         """Generate copywriting for the given project."""
-        project = get_project_by_id(owner_id=request.user.id, project_id=project_id)
+        project = get_project_with_content(owner_id=request.user.id, project_id=project_id)
         if not project:
             return Response(
                 {"error": "Project not found or access denied."},
@@ -171,6 +189,14 @@ class CopywritingRegenerateSectionView(APIView):
         section = serializer.validated_data['section']
         instruction = serializer.validated_data['instruction']
         
+        if serializer.validated_data['stream']:
+            response = StreamingHttpResponse(
+                self.stream_events(session, section, instruction),
+                content_type='text/event-stream',
+            )
+            response['Cache-Control'] = 'no-cache'
+            return response
+        
         _, new_value = regenerate_session_section(
             session=session,
             section=section,
@@ -184,6 +210,22 @@ class CopywritingRegenerateSectionView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+    
+    def stream_events(self, session, section, instruction):
+        """Yield the regenerated section as server-sent events."""
+        try:
+            for chunk in stream_regenerate_session_section(
+                session=session,
+                section=section,
+                instruction=instruction,
+            ):
+                yield format_sse_event('chunk', chunk)
+        except Exception:
+            logger.exception("Streaming regeneration failed for session %s", session.id)
+            yield format_sse_event('error', 'Failed to regenerate section.')
+            return
+        
+        yield format_sse_event('done', section)
 
 
 
@@ -1,3 +1,4 @@
+import orjson
 import requests
 import logging
 from typing import List, Dict, Any, Iterable, Optional, Union
@@ -46,7 +47,7 @@ class GoogleSearchClient:
         if not self.search_engine_id:
             raise ValueError("Search Engine ID is required. Set GOOGLE_SEARCH_ENGINE_ID in settings.")
         
-        logger.info(f"Initialized GoogleSearchClient with {len(self.api_keys)} API key(s)")
+        logger.info("Initialized GoogleSearchClient with %s API key(s)", len(self.api_keys))
     
     def _is_key_exhausted(self, api_key: str) -> bool:
         """Check if an API key is marked as exhausted in cache."""
@@ -57,7 +58,7 @@ class GoogleSearchClient:
         """Mark an API key as exhausted in cache for 24 hours."""
         cache_key = f"{self.CACHE_KEY_PREFIX}{api_key[:10]}"
         cache.set(cache_key, True, self.CACHE_TIMEOUT)
-        logger.warning(f"API key {api_key[:10]}... marked as exhausted")
+        logger.warning("API key %s... marked as exhausted", api_key[:10])
     
     def _is_quota_error(self, response: requests.Response) -> bool:
         """Check if the response indicates a quota exceeded error."""
@@ -65,7 +66,7 @@ class GoogleSearchClient:
             return True
         
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             error = data.get('error', {})
             
             if error.get('code') in [403, 429]:
@@ -119,7 +120,7 @@ class GoogleSearchClient:
                 "Please wait 24 hours or add more API keys."
             )
         
-        logger.info(f"Attempting search with {len(available_keys)} available key(s)")
+        logger.info("Attempting search with %s available key(s)", len(available_keys))
         
         base_params = {
             "cx": self.search_engine_id,
@@ -156,25 +157,25 @@ class GoogleSearchClient:
             params = {**base_params, "key": api_key}
             
             try:
-                logger.debug(f"Trying API key {idx}/{len(available_keys)}")
+                logger.debug("Trying API key %s/%s", idx, len(available_keys))
                 response = requests.get(self.BASE_URL, params=params, timeout=30)
                 
                 if self._is_quota_error(response):
-                    logger.warning(f"API key {idx} quota exceeded, trying next key...")
+                    logger.warning("API key %s quota exceeded, trying next key...", idx)
                     self._mark_key_exhausted(api_key)
                     last_error = GoogleSearchError("API quota exceeded")
                     continue
 
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
-                logger.info(f"Search successful with API key {idx}")
+                logger.info("Search successful with API key %s", idx)
                 results = self._parse_results(data)
                 return results
                 
             except requests.exceptions.HTTPError as e:
                 if e.response and self._is_quota_error(e.response):
-                    logger.warning(f"API key {idx} quota exceeded (HTTP error), trying next key...")
+                    logger.warning("API key %s quota exceeded (HTTP error), trying next key...", idx)
                     self._mark_key_exhausted(api_key)
                     last_error = GoogleSearchError(f"API quota exceeded: {str(e)}")
                     continue
@@ -183,7 +184,7 @@ class GoogleSearchClient:
                 
             except requests.exceptions.RequestException as e:
                 last_error = GoogleSearchError(f"Request failed: {str(e)}")
-                logger.error(f"Request failed with API key {idx}: {str(e)}")
+                logger.error("Request failed with API key %s: %s", idx, e)
                 continue
                 
             except ValueError as e:
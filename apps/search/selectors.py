@@ -25,11 +25,7 @@ def get_project_by_id(owner_id: int, project_id: UUID) -> Optional[Project]:
     Returns None when not found or not owned by the user.
     """
 
-    return (
-        Project.objects.select_related("owner")
-        .filter(id=project_id, owner_id=owner_id)
-        .first()
-    )
+    return Project.objects.filter(id=project_id, owner_id=owner_id).first()
 
 
 def get_search_request_by_id(project: Project, search_request_id: UUID) -> Optional[SearchRequest]:
@@ -42,6 +38,17 @@ def get_search_request_by_id(project: Project, search_request_id: UUID) -> Optio
     )
 
 
+def get_search_result_for_project(project: Project, search_result_id: UUID) -> Optional[SearchResult]:
+    """Fetch a search result belonging to the provided project.
+
+    Returns None when not found or when it belongs to another project.
+    """
+
+    return SearchResult.objects.filter(
+        id=search_result_id, search_request__project=project
+    ).first()
+
+
 def list_search_requests_for_project(project: Project) -> QuerySet[SearchRequest]:
     """List all search requests for a project."""
 
@@ -338,6 +338,9 @@ GEMINI_TEMPERATURE = config('GEMINI_TEMPERATURE', default=0.7, cast=float)
 GEMINI_MAX_OUTPUT_TOKENS = config('GEMINI_MAX_OUTPUT_TOKENS', default=8192, cast=int)
 GEMINI_TOP_P = config('GEMINI_TOP_P', default=0.95, cast=float)
 GEMINI_TOP_K = config('GEMINI_TOP_K', default=40, cast=int)
+# Seconds to reuse copy generated from identical inputs; 0 disables the cache.
+# The default cache is LocMemCache, so cached copy is per process.
+COPYWRITING_GENERATION_CACHE_TIMEOUT = config('COPYWRITING_GENERATION_CACHE_TIMEOUT', default=0, cast=int)
 
 
 
@@ -352,6 +355,16 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CELERY_RESULT_EXPIRES = 3600  # 1 hour
 
+# Network-bound tasks that mostly wait on Gemini or CDN sockets run on a
+# separate queue, served by a thread-pool worker so they don't hold prefork slots
+CELERY_TASK_ROUTES = {
+    'apps.content.tasks.download_video_task': {'queue': 'io'},
+    'apps.content.tasks.generate_subtitle_task': {'queue': 'io'},
+    'apps.content.tasks.poll_subtitle_file_task': {'queue': 'io'},
+    'apps.content.tasks.transcribe_subtitle_file_task': {'queue': 'io'},
+    'apps.content.tasks.translate_subtitle_task': {'queue': 'io'},
+}
+
 
 
 # APIHUT.IN API Configuration
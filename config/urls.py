@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.urls import include, path
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
@@ -13,7 +14,8 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     
     # API Documentation URLs
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    # The schema only changes on deploy, so it is generated once per process
+    path('api/schema/', cache_page(60 * 60 * 24)(SpectacularAPIView.as_view()), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     
@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+# Import the URLconf (and with it every view module) and build the resolver
+# now, so the first request each worker serves does not pay for it.
+get_resolver().reverse_dict